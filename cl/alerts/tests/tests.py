@@ -3879,7 +3879,7 @@ class OneClickUnsubscribeTests(TestCase):
 
         # check unsubscription confirmation email
         self.assertEqual(len(mail.outbox), 1)
-        self.assertIn("[Unsubscribed]", mail.outbox[0].subject)
+        self.assertTrue(mail.outbox[0].subject.startswith("[Unsubscribed]"))
 
 
 @override_settings(EMAIL_BACKEND="cl.lib.email_backends.EmailBackend")
@@ -3,10 +3,11 @@ import time
 from datetime import timedelta
 
 from django.db import transaction
+from django.db.models import F
 from django.utils.timezone import now
 
 from cl.api.models import WEBHOOK_EVENT_STATUS, Webhook, WebhookEvent
-from cl.api.webhooks import send_webhook_event
+from cl.api.webhooks import send_webhook_events
 from cl.lib.command_utils import VerboseCommand
 from cl.lib.redis_utils import get_redis_interface
 from cl.users.tasks import send_webhook_still_disabled_email
@@ -14,8 +15,9 @@ from cl.users.tasks import send_webhook_still_disabled_email
 DAYS_TO_DELETE = 90
 
 # It must be greater than the elapsed time after reaching the max retries.
-# Currently, that's about 54 hours (3 min delay with 3× backoff).
-HOURS_WEBHOOKS_CUT_OFF = 60
+# Currently, that's about 54 hours (3 min delay with 3× backoff), and up to
+# about 60 hours when every delay draws the maximum +10% retry jitter.
+HOURS_WEBHOOKS_CUT_OFF = 66
 
 
 def retry_webhook_events() -> int:
@@ -48,15 +50,22 @@ def retry_webhook_events() -> int:
             date_created__gte=created_date_cut_off,
         ).update(retry_counter=0, date_modified=now())
 
-        webhook_events_to_retry = base_events.filter(
-            event_status__in=[
-                WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-                WEBHOOK_EVENT_STATUS.ENDPOINT_DISABLED,
-            ],
-            date_created__gte=created_date_cut_off,
-        ).order_by("date_created")
-        for webhook_event in webhook_events_to_retry:
-            send_webhook_event(webhook_event)
+        webhook_events_to_retry = list(
+            base_events.filter(
+                event_status__in=[
+                    WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    WEBHOOK_EVENT_STATUS.ENDPOINT_DISABLED,
+                ],
+                date_created__gte=created_date_cut_off,
+            )
+            .annotate(webhook_url=F("webhook__url"))
+            .order_by("date_created")
+        )
+        urls = [
+            event.webhook_url  # type: ignore[attr-defined]
+            for event in webhook_events_to_retry
+        ]
+        send_webhook_events(webhook_events_to_retry, urls)
     return len(webhook_events_to_retry)
 
 
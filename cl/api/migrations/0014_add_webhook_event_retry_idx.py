@@ -0,0 +1,25 @@
+# Generated by Django 5.1.7 on 2026-10-15 23:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0013_add_webhook_version_choices_noop"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="webhookevent",
+            index=models.Index(
+                condition=models.Q(
+                    ("debug", False), ("event_status__in", [1, 4])
+                ),
+                fields=["next_retry_date"],
+                name="webhook_event_retry_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,4 @@
+--
+-- Concurrently create index webhook_event_retry_idx on field(s) next_retry_date of model webhookevent
+--
+CREATE INDEX CONCURRENTLY "webhook_event_retry_idx" ON "api_webhookevent" ("next_retry_date") WHERE (NOT "debug" AND "event_status" IN (1, 4));
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-15 23:04
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0014_add_webhook_event_retry_idx"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="webhookevent",
+            name="api_webhook_next_re_3e78b7_idx",
+        ),
+    ]
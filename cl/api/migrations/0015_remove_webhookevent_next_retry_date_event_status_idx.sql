@@ -0,0 +1,4 @@
+--
+-- Concurrently remove index api_webhook_next_re_3e78b7_idx from webhookevent
+--
+DROP INDEX CONCURRENTLY IF EXISTS "api_webhook_next_re_3e78b7_idx";
@@ -136,7 +136,17 @@ class WebhookEvent(AbstractDateTimeModel):
 
     class Meta:
         indexes = [
-            models.Index(fields=["next_retry_date", "event_status"]),
+            models.Index(
+                fields=["next_retry_date"],
+                name="webhook_event_retry_idx",
+                condition=models.Q(
+                    event_status__in=[
+                        WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                        WEBHOOK_EVENT_STATUS.ENDPOINT_DISABLED,
+                    ],
+                    debug=False,
+                ),
+            ),
         ]
 
     def __str__(self) -> str:
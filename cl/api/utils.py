@@ -1,4 +1,5 @@
 import logging
+import random
 from collections import OrderedDict, defaultdict
 from datetime import date, datetime, timedelta, timezone
 from itertools import batched, chain
@@ -847,6 +848,18 @@ def get_avg_ms_for_endpoint(endpoint: str, d: datetime) -> float:
     return results[0] / results[1]
 
 
+WEBHOOK_MAX_RETRY_COUNTER = 7
+# The delay before the next retry for each retry counter, an exponential
+# backoff starting at 3 minutes.
+WEBHOOK_RETRY_DELAYS = tuple(
+    timedelta(minutes=pow(3, retry_counter + 1))
+    for retry_counter in range(WEBHOOK_MAX_RETRY_COUNTER)
+)
+# Each delay is scaled by a random factor within this fraction of itself, so
+# events that failed together don't all retry in the same minute.
+WEBHOOK_RETRY_JITTER = 0.1
+
+
 def get_next_webhook_retry_date(retry_counter: int) -> datetime:
     """Returns the next retry datetime to schedule a webhook retry based on its
     current retry counter.
@@ -865,25 +878,25 @@ def get_next_webhook_retry_date(retry_counter: int) -> datetime:
             7      |     36:27
 
 
+    Each delay is jittered by up to WEBHOOK_RETRY_JITTER (±10%) to spread out
+    the retries of events that failed at the same time.
+
     The total elapsed time might vary for each webhook event depending on when
     the retry is executed since the retry method is going to be executed every
     minute. On average the total elapsed time in the 7th retry would be 54
-    hours and 39 minutes.
+    hours and 39 minutes, and at most about 60 hours and 7 minutes with the
+    maximum jitter on every retry.
 
     :param retry_counter: The current retry_counter used to compute the next
     retry date.
     :return datatime: The next retry datetime.
     """
 
-    INITIAL_TIME = 3  # minutes
-    # Update new_next_retry_date exponentially
-    new_next_retry_date = now() + timedelta(
-        minutes=pow(INITIAL_TIME, retry_counter + 1)
-    )
-    return new_next_retry_date
-
-
-WEBHOOK_MAX_RETRY_COUNTER = 7
+    delay = WEBHOOK_RETRY_DELAYS[
+        min(retry_counter, len(WEBHOOK_RETRY_DELAYS) - 1)
+    ]
+    jitter = random.uniform(1 - WEBHOOK_RETRY_JITTER, 1 + WEBHOOK_RETRY_JITTER)
+    return now() + delay * jitter
 
 
 def check_webhook_failure_count_and_notify(
@@ -984,6 +997,17 @@ def update_webhook_event_after_request(
             failed_request = True
     webhook_event.status_code = status_code
     webhook_event.response = data
+    # Only write the fields changed here. Saving the whole event would also
+    # rewrite its JSON content, which can be large.
+    update_fields = [
+        "status_code",
+        "response",
+        "error_message",
+        "event_status",
+        "retry_counter",
+        "next_retry_date",
+        "date_modified",
+    ]
 
     if failed_request or error:
         if error is None:
@@ -994,7 +1018,7 @@ def update_webhook_event_after_request(
             # If the webhook has reached the max retry counter, mark as failed
             webhook_event.event_status = WEBHOOK_EVENT_STATUS.FAILED
             webhook_event.retry_counter = F("retry_counter") + 1
-            webhook_event.save()
+            webhook_event.save(update_fields=update_fields)
             return
 
         webhook_event.next_retry_date = get_next_webhook_retry_date(
@@ -1011,7 +1035,7 @@ def update_webhook_event_after_request(
             # Only log successful webhook events and not debug.
             results = log_webhook_event(webhook_event.webhook.user.pk)
             handle_webhook_events(results, webhook_event.webhook.user)
-    webhook_event.save()
+    webhook_event.save(update_fields=update_fields)
 
 
 class WebhookKeyType(TypedDict):
@@ -1,5 +1,7 @@
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import requests
 from django.conf import settings
@@ -30,15 +32,19 @@ from cl.search.api_serializers import (
     V3OpinionESResultSerializer,
 )
 
+# The number of webhook POST requests sent at once when retrying events.
+WEBHOOK_MAX_CONCURRENT_REQUESTS = 10
 
-def send_webhook_event(
+
+def get_webhook_request_kwargs(
     webhook_event: WebhookEvent, content_bytes: bytes | None = None
-) -> None:
-    """Send the webhook POST request.
+) -> dict[str, Any]:
+    """Build the keyword arguments for the webhook POST request.
 
     :param webhook_event: An WebhookEvent to send.
     :param content_bytes: Optional, the bytes JSON content to send the first time
     the webhook is sent.
+    :return: A dict of keyword arguments for requests.post.
     """
     proxy_server = {
         "http": random.choice(settings.EGRESS_PROXY_HOSTS),  # type: ignore
@@ -60,24 +66,79 @@ def send_webhook_event(
     json_data = json.loads(json_bytes)
     if json_data == {}:
         raise ValueError("Webhook payload is empty.")
+    return {
+        "proxies": proxy_server,
+        "json": json_data,
+        "timeout": (3, 3),
+        "headers": headers,
+        "allow_redirects": False,
+    }
+
+
+def post_webhook_request(
+    url: str, request_kwargs: dict[str, Any]
+) -> tuple[requests.Response | None, str]:
+    """Send the webhook POST request.
+
+    :param url: The webhook endpoint URL.
+    :param request_kwargs: The keyword arguments for requests.post.
+    :return: A two tuple, the response or None if the request failed, and the
+    error message if the request failed.
+    """
     try:
         # To send a POST to an HTTPS target and using webhook-sentry as proxy,
         # you needed to change the protocol to HTTP and set the X-WhSentry-TLS
         # header to true. See https://github.com/juggernaut/webhook-sentry#https-target
-        url = webhook_event.webhook.url.replace("https://", "http://")
-        response = requests.post(
-            url,
-            proxies=proxy_server,
-            json=json_data,
-            timeout=(3, 3),
-            headers=headers,
-            allow_redirects=False,
-        )
-        update_webhook_event_after_request(webhook_event, response)
+        url = url.replace("https://", "http://")
+        return requests.post(url, **request_kwargs), ""
     except (requests.ConnectionError, requests.Timeout) as exc:
         error_str = f"{type(exc).__name__}: {exc}"
         trunc(error_str, 500)
-        update_webhook_event_after_request(webhook_event, error=error_str)
+        return None, error_str
+
+
+def send_webhook_event(
+    webhook_event: WebhookEvent, content_bytes: bytes | None = None
+) -> None:
+    """Send the webhook POST request.
+
+    :param webhook_event: An WebhookEvent to send.
+    :param content_bytes: Optional, the bytes JSON content to send the first time
+    the webhook is sent.
+    """
+    request_kwargs = get_webhook_request_kwargs(webhook_event, content_bytes)
+    response, error = post_webhook_request(
+        webhook_event.webhook.url, request_kwargs
+    )
+    update_webhook_event_after_request(webhook_event, response, error)
+
+
+def send_webhook_events(
+    webhook_events: list[WebhookEvent], urls: list[str]
+) -> None:
+    """Send a batch of webhook events, overlapping their POST requests.
+
+    The requests are sent from a thread pool, but the events are updated one
+    by one afterward and in the given order, since updating an event can
+    disable its parent webhook and notify the owner about it.
+
+    :param webhook_events: The WebhookEvents to send.
+    :param urls: The endpoint URL for each WebhookEvent. Passing them avoids
+    loading each parent webhook before the previous events are updated.
+    :return: None
+    """
+    requests_kwargs = [
+        get_webhook_request_kwargs(webhook_event)
+        for webhook_event in webhook_events
+    ]
+    with ThreadPoolExecutor(
+        max_workers=WEBHOOK_MAX_CONCURRENT_REQUESTS
+    ) as executor:
+        results = list(
+            executor.map(post_webhook_request, urls, requests_kwargs)
+        )
+    for webhook_event, (response, error) in zip(webhook_events, results):
+        update_webhook_event_after_request(webhook_event, response, error)
 
 
 def send_old_alerts_webhook_event(
@@ -1,15 +1,14 @@
 import json
 from http import HTTPStatus
-from pathlib import Path
 from unittest import mock
 
 from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
-from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.core import mail
 from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Count, Q
 from django.test import override_settings
 from django.urls import reverse
 
@@ -17,6 +16,7 @@ from cl.alerts.models import DocketAlert
 from cl.api.factories import WEBHOOK_EVENT_STATUS, WebhookFactory
 from cl.api.models import Webhook, WebhookEvent, WebhookEventType
 from cl.api.utils import get_webhook_deprecation_date
+from cl.lib.crypto import sha1
 from cl.recap.factories import (
     AppellateAttachmentFactory,
     AppellateAttachmentPageFactory,
@@ -36,7 +36,11 @@ from cl.recap.tasks import (
     mark_pq_successful,
     set_rd_sealed_status,
 )
-from cl.recap.tests.tests import mock_bucket_open
+from cl.recap.tests.tests import (
+    TEST_PASSWORD_HASH,
+    load_recap_email_fixture,
+    mock_bucket_open,
+)
 from cl.search.factories import (
     CourtFactory,
     DocketEntryFactory,
@@ -58,17 +62,14 @@ class RecapEmailToEmailProcessingQueueTest(TestCase):
     @classmethod
     def setUpTestData(cls):
         cls.court = CourtFactory(id="txwd", jurisdiction="FB")
-        test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
-        with open(
-            test_dir / "recap_mail_custom_receipt.json",
-            encoding="utf-8",
-        ) as file:
-            recap_mail_receipt = json.load(file)
-            cls.data = {
-                "court": cls.court.id,
-                "mail": recap_mail_receipt["mail"],
-                "receipt": recap_mail_receipt["receipt"],
-            }
+        recap_mail_receipt = load_recap_email_fixture(
+            "recap_mail_custom_receipt.json"
+        )
+        cls.data = {
+            "court": cls.court.id,
+            "mail": recap_mail_receipt["mail"],
+            "receipt": recap_mail_receipt["receipt"],
+        }
 
     def setUp(self) -> None:
         self.async_client = AsyncAPIClient()
@@ -151,58 +152,45 @@ class RecapEmailDocketAlerts(TestCase):
         cls.court_nda = CourtFactory(id="ca9", jurisdiction="F")
         cls.court_nyed = CourtFactory(id="nyed", jurisdiction="FD")
         cls.court_jpml = CourtFactory(id="jpml", jurisdiction="FS")
-        cls.webhook = WebhookFactory(
-            user=cls.user_profile.user,
-            event_type=WebhookEventType.DOCKET_ALERT,
-            url="https://example.com/",
-            enabled=True,
-            version=1,
-        )
-        cls.webhook_2 = WebhookFactory(
-            user=cls.user_profile_2.user,
-            event_type=WebhookEventType.DOCKET_ALERT,
-            url="https://example.com/",
-            enabled=True,
-            version=2,
-        )
-        test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
-        with (
-            open(
-                test_dir / "recap_mail_custom_receipt.json",
-                encoding="utf-8",
-            ) as file,
-            open(
-                test_dir / "recap_mail_custom_receipt_2.json",
-                encoding="utf-8",
-            ) as file_2,
-            open(
-                test_dir / "recap_mail_custom_receipt_3.json",
-                encoding="utf-8",
-            ) as file_3,
-            open(
-                test_dir / "recap_mail_custom_receipt_4.json",
-                encoding="utf-8",
-            ) as file_4,
-            open(
-                test_dir / "recap_mail_custom_receipt_nda.json",
-                encoding="utf-8",
-            ) as file_5,
-            open(
-                test_dir / "recap_mail_custom_receipt_no_re_user.json",
-                encoding="utf-8",
-            ) as file_6,
-            open(
-                test_dir / "recap_mail_custom_receipt_multi_nef_jpml.json",
-                encoding="utf-8",
-            ) as file_jpml,
-        ):
-            recap_mail_receipt = json.load(file)
-            recap_mail_receipt_2 = json.load(file_2)
-            recap_mail_receipt_3 = json.load(file_3)
-            recap_mail_receipt_4 = json.load(file_4)
-            recap_mail_receipt_nda = json.load(file_5)
-            recap_mail_receipt_no_re_user = json.load(file_6)
-            recap_mail_receipt_multi_nef_jpml = json.load(file_jpml)
+        cls.webhook, cls.webhook_2 = Webhook.objects.bulk_create(
+            [
+                WebhookFactory.build(
+                    user=cls.user_profile.user,
+                    event_type=WebhookEventType.DOCKET_ALERT,
+                    url="https://example.com/",
+                    enabled=True,
+                    version=1,
+                ),
+                WebhookFactory.build(
+                    user=cls.user_profile_2.user,
+                    event_type=WebhookEventType.DOCKET_ALERT,
+                    url="https://example.com/",
+                    enabled=True,
+                    version=2,
+                ),
+            ]
+        )
+        recap_mail_receipt = load_recap_email_fixture(
+            "recap_mail_custom_receipt.json"
+        )
+        recap_mail_receipt_2 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_2.json"
+        )
+        recap_mail_receipt_3 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_3.json"
+        )
+        recap_mail_receipt_4 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_4.json"
+        )
+        recap_mail_receipt_nda = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda.json"
+        )
+        recap_mail_receipt_no_re_user = load_recap_email_fixture(
+            "recap_mail_custom_receipt_no_re_user.json"
+        )
+        recap_mail_receipt_multi_nef_jpml = load_recap_email_fixture(
+            "recap_mail_custom_receipt_multi_nef_jpml.json"
+        )
 
         cls.data = {
             "court": cls.court.id,
@@ -225,21 +213,25 @@ class RecapEmailDocketAlerts(TestCase):
             "mail": recap_mail_receipt_4["mail"],
             "receipt": recap_mail_receipt_4["receipt"],
         }
-        cls.data_5 = {
-            "court": cls.court_nda.id,
-            "mail": recap_mail_receipt_nda["mail"],
-            "receipt": recap_mail_receipt_nda["receipt"],
-        }
+        cls.data_5 = json.dumps(
+            {
+                "court": cls.court_nda.id,
+                "mail": recap_mail_receipt_nda["mail"],
+                "receipt": recap_mail_receipt_nda["receipt"],
+            }
+        )
         cls.data_no_user = {
             "court": cls.court.id,
             "mail": recap_mail_receipt_no_re_user["mail"],
             "receipt": recap_mail_receipt_no_re_user["receipt"],
         }
-        cls.data_multi_jpml = {
-            "court": cls.court_jpml.id,
-            "mail": recap_mail_receipt_multi_nef_jpml["mail"],
-            "receipt": recap_mail_receipt_multi_nef_jpml["receipt"],
-        }
+        cls.data_multi_jpml = json.dumps(
+            {
+                "court": cls.court_jpml.id,
+                "mail": recap_mail_receipt_multi_nef_jpml["mail"],
+                "receipt": recap_mail_receipt_multi_nef_jpml["receipt"],
+            }
+        )
         cls.no_magic_number_data = RECAPEmailNotificationDataFactory(
             contains_attachments=False,
             dockets=[
@@ -293,7 +285,7 @@ class RecapEmailDocketAlerts(TestCase):
 
         recipient_user = self.user_profile
         recipient_user.user.email = "testing_1@mail.com"
-        recipient_user.user.password = make_password("password")
+        recipient_user.user.password = TEST_PASSWORD_HASH
         recipient_user.user.save()
         recipient_user.recap_email = "testing_1@recap.email"
         recipient_user.auto_subscribe = True
@@ -302,13 +294,28 @@ class RecapEmailDocketAlerts(TestCase):
 
         recipient_user_2 = self.user_profile_2
         recipient_user_2.user.email = "testing_2@mail.com"
-        recipient_user_2.user.password = make_password("password")
+        recipient_user_2.user.password = TEST_PASSWORD_HASH
         recipient_user_2.user.save()
         recipient_user_2.recap_email = "testing_2@recap.email"
         recipient_user_2.auto_subscribe = True
         recipient_user_2.save()
         self.recipient_user_2 = recipient_user_2
 
+    def assert_webhook_content_matches_rd(
+        self, content: dict, rd: RECAPDocument
+    ) -> None:
+        """Confirm the first RECAPDocument in a docket alert webhook payload
+        is the given RD.
+
+        :param content: The WebhookEvent content.
+        :param rd: The RECAPDocument expected in the payload.
+        :return: None
+        """
+        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
+            "pacer_doc_id"
+        ]
+        self.assertEqual(rd.pacer_doc_id, pacer_doc_id)
+
     @mock.patch(
         "cl.recap.tasks.download_pdf_by_magic_number",
         side_effect=lambda z, x, c, v, b, d, e: (None, ""),
@@ -348,7 +355,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Subscription type, since user has
         # auto-subscribe True.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -376,13 +383,10 @@ class RecapEmailDocketAlerts(TestCase):
         )
         content = webhook_triggered_first.content
         # Compare the content of the webhook to the recap document
-        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
-            "pacer_doc_id"
-        ]
         docket_id = content["payload"]["results"][0]["docket"]
         self.assertEqual(docket.pk, docket_id)
         await recap_document_first.arefresh_from_db()
-        self.assertEqual(recap_document_first.pacer_doc_id, pacer_doc_id)
+        self.assert_webhook_content_matches_rd(content, recap_document_first)
 
     @mock.patch(
         "cl.recap.tasks.download_pdf_by_magic_number",
@@ -421,7 +425,7 @@ class RecapEmailDocketAlerts(TestCase):
         )
 
         # A DocketAlert email for testing_2@recap.email should go out
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -497,31 +501,23 @@ class RecapEmailDocketAlerts(TestCase):
         self.assertEqual(await webhook_2_user_1.acount(), 1)
 
         # Confirm webhook versions.
-        version_1_webhook = await webhook_user_1.afirst()
-        webhook_version = version_1_webhook.content["webhook"]["version"]
-        self.assertEqual(webhook_version, 1)
+        v1_webhook_content = (await webhook_user_1.afirst()).content
+        self.assertEqual(v1_webhook_content["webhook"]["version"], 1)
 
-        version_2_webhook = await webhook_2_user_1.afirst()
-        webhook_version = version_2_webhook.content["webhook"]["version"]
-        self.assertEqual(webhook_version, 2)
+        v2_webhook_content = (await webhook_2_user_1.afirst()).content
+        self.assertEqual(v2_webhook_content["webhook"]["version"], 2)
 
         version_2_webhook = await webhook_user_2.afirst()
         webhook_version = version_2_webhook.content["webhook"]["version"]
         self.assertEqual(webhook_version, 2)
 
         # Confirm deprecation date webhooks according the version.
-        v1_webhook_event = await WebhookEvent.objects.filter(
-            webhook=self.webhook
-        ).afirst()
-        v2_webhook_event = await WebhookEvent.objects.filter(
-            webhook=webhook_2_1
-        ).afirst()
         self.assertEqual(
-            v1_webhook_event.content["webhook"]["deprecation_date"],
+            v1_webhook_content["webhook"]["deprecation_date"],
             get_webhook_deprecation_date(settings.WEBHOOK_V1_DEPRECATION_DATE),
         )
         self.assertEqual(
-            v2_webhook_event.content["webhook"]["deprecation_date"], None
+            v2_webhook_content["webhook"]["deprecation_date"], None
         )
 
     @mock.patch(
@@ -565,7 +561,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Unsubscription type, since user has the
         # auto-subscribe False.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -641,7 +637,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Unsubscription type, since user has the
         # auto-subscribe False.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -762,7 +758,7 @@ class RecapEmailDocketAlerts(TestCase):
         )
 
         # A DocketAlert email for testing_2@recap.email should go out
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -810,11 +806,8 @@ class RecapEmailDocketAlerts(TestCase):
         webhook_triggered_first = await webhook_triggered.afirst()
         content = webhook_triggered_first.content
         # Compare the content of the webhook to the recap document
-        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
-            "pacer_doc_id"
-        ]
         await recap_document_first.arefresh_from_db()
-        self.assertEqual(recap_document_first.pacer_doc_id, pacer_doc_id)
+        self.assert_webhook_content_matches_rd(content, recap_document_first)
         self.assertEqual(
             webhook_triggered_first.event_status,
             WEBHOOK_EVENT_STATUS.SUCCESSFUL,
@@ -875,11 +868,8 @@ class RecapEmailDocketAlerts(TestCase):
         )
         content = webhook_triggered_2_first.content
         # Compare the content of the webhook to the recap document
-        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
-            "pacer_doc_id"
-        ]
         await recap_document_first.arefresh_from_db()
-        self.assertEqual(recap_document_first.pacer_doc_id, pacer_doc_id)
+        self.assert_webhook_content_matches_rd(content, recap_document_first)
 
     @mock.patch(
         "cl.recap.tasks.download_pdf_by_magic_number",
@@ -913,7 +903,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Unsubscription type, since user has the
         # auto-subscribe False.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -923,8 +913,7 @@ class RecapEmailDocketAlerts(TestCase):
             docket=docket,
             alert_type=DocketAlert.UNSUBSCRIPTION,
         )
-        docket_alert_first = await docket_alert.afirst()
-        self.assertEqual(await docket_alert.acount(), 1)
+        [docket_alert_first] = [da async for da in docket_alert]
 
         # No webhook should be triggered for testing_1@recap.email
         webhook_triggered = WebhookEvent.objects.filter()
@@ -932,9 +921,7 @@ class RecapEmailDocketAlerts(TestCase):
         self.assertEqual(await webhook_triggered.acount(), 0)
 
         # Authenticate user to avoid the subscription confirmation form
-        await self.async_client.alogin(
-            username=self.recipient_user.user.username, password="password"
-        )
+        await self.async_client.aforce_login(user=self.recipient_user.user)
         # Subscribe to the case from first user-case email subscription link
         await self.async_client.get(
             reverse(
@@ -948,7 +935,7 @@ class RecapEmailDocketAlerts(TestCase):
             alert_type=DocketAlert.SUBSCRIPTION,
         )
         # The DocketAlert should be toggled to Subscription type.
-        self.assertEqual(await docket_alert.acount(), 0)
+        self.assertFalse(await docket_alert.aexists())
         self.assertEqual(await docket_alert_subscription.acount(), 1)
 
     @mock.patch(
@@ -980,7 +967,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Subscription type, since user has
         # auto-subscribe True.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -989,8 +976,7 @@ class RecapEmailDocketAlerts(TestCase):
             user=self.recipient_user.user,
             docket=docket,
         )
-        self.assertEqual(await docket_alert.acount(), 1)
-        docket_alert_first = await docket_alert.afirst()
+        [docket_alert_first] = [da async for da in docket_alert]
         self.assertEqual(
             docket_alert_first.alert_type, DocketAlert.SUBSCRIPTION
         )
@@ -1003,17 +989,16 @@ class RecapEmailDocketAlerts(TestCase):
         # One webhook should be triggered for testing_1@recap.email
         webhook_triggered = WebhookEvent.objects.filter()
         # Does the webhook was triggered?
-        self.assertEqual(await webhook_triggered.acount(), 1)
-        webhook_triggered_first = await webhook_triggered.afirst()
-        self.assertEqual(
-            webhook_triggered_first.event_status,
-            WEBHOOK_EVENT_STATUS.SUCCESSFUL,
+        webhook_stats = await webhook_triggered.aaggregate(
+            total=Count("pk"),
+            successful=Count(
+                "pk", filter=Q(event_status=WEBHOOK_EVENT_STATUS.SUCCESSFUL)
+            ),
         )
+        self.assertEqual(webhook_stats, {"total": 1, "successful": 1})
 
         # Authenticate user to avoid the unsubscription confirmation form
-        await self.async_client.alogin(
-            username=self.recipient_user.user.username, password="password"
-        )
+        await self.async_client.aforce_login(user=self.recipient_user.user)
         # Unsubscribe from email link
         await self.async_client.get(
             reverse(
@@ -1031,7 +1016,7 @@ class RecapEmailDocketAlerts(TestCase):
         # The unsubscription confirmation email should go out
         self.assertEqual(len(mail.outbox), 2)
         message_sent = mail.outbox[1]
-        self.assertIn("[Unsubscribed]", message_sent.subject)
+        self.assertTrue(message_sent.subject.startswith("[Unsubscribed]"))
 
         # Trigger a new recap.email notification, same case, different document
         # from testing_1@recap.email
@@ -1079,7 +1064,7 @@ class RecapEmailDocketAlerts(TestCase):
         # for this case with Unsubscription type, since user has the
         # auto-subscribe False.
         email_processing = EmailProcessingQueue.objects.all().order_by("pk")
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -1129,17 +1114,18 @@ class RecapEmailDocketAlerts(TestCase):
         # No webhook should be triggered.
         self.assertEqual(await webhook_triggered.acount(), 0)
 
-        # Authenticate user to avoid the confirmation form
-        await self.async_client.alogin(
-            username=self.recipient_user.user.username, password="password"
+        subscribe_url = reverse(
+            "toggle_docket_alert_confirmation",
+            args=["subscribe", docket_alert_first.secret_key],
         )
-        # Subscribe to the case from first user-case email subscription link
-        await self.async_client.get(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["subscribe", docket_alert_first.secret_key],
-            )
+        unsubscribe_url = reverse(
+            "toggle_docket_alert_confirmation",
+            args=["unsubscribe", docket_alert_first.secret_key],
         )
+        # Authenticate user to avoid the confirmation form
+        await self.async_client.aforce_login(user=self.recipient_user.user)
+        # Subscribe to the case from first user-case email subscription link
+        await self.async_client.get(subscribe_url)
         await docket_alert_first.arefresh_from_db()
         self.assertEqual(
             docket_alert_first.alert_type, DocketAlert.SUBSCRIPTION
@@ -1172,18 +1158,14 @@ class RecapEmailDocketAlerts(TestCase):
         )
 
         # A webhook event should be triggered since user is now subscribed.
-        self.assertEqual(await webhook_triggered.acount(), 1)
-        webhook_triggered_first = await webhook_triggered.afirst()
-        self.assertEqual(
-            webhook_triggered_first.event_status,
-            WEBHOOK_EVENT_STATUS.SUCCESSFUL,
-        )
-        await self.async_client.get(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["unsubscribe", docket_alert_first.secret_key],
-            )
+        webhook_stats = await webhook_triggered.aaggregate(
+            total=Count("pk"),
+            successful=Count(
+                "pk", filter=Q(event_status=WEBHOOK_EVENT_STATUS.SUCCESSFUL)
+            ),
         )
+        self.assertEqual(webhook_stats, {"total": 1, "successful": 1})
+        await self.async_client.get(unsubscribe_url)
 
         # The DocketAlert should be toggled to Unsubscription type.
         await docket_alert_first.arefresh_from_db()
@@ -1194,7 +1176,7 @@ class RecapEmailDocketAlerts(TestCase):
         # The unsubscription confirmation email should go out
         self.assertEqual(len(mail.outbox), 3)
         message_sent = mail.outbox[2]
-        self.assertIn("[Unsubscribed]", message_sent.subject)
+        self.assertTrue(message_sent.subject.startswith("[Unsubscribed]"))
 
     @mock.patch(
         "cl.recap.tasks.download_pdf_by_magic_number",
@@ -1225,7 +1207,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Subscription type, since user has
         # auto-subscribe True.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -1234,26 +1216,22 @@ class RecapEmailDocketAlerts(TestCase):
             user=self.recipient_user.user,
             docket=docket,
         )
-        self.assertEqual(await docket_alert.acount(), 1)
-        docket_alert_first = await docket_alert.afirst()
+        [docket_alert_first] = [da async for da in docket_alert]
         self.assertEqual(
             docket_alert_first.alert_type, DocketAlert.SUBSCRIPTION
         )
-
-        # Unauthenticated user tries to unsubscribe via GET and POST
-        await self.async_client.get(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["unsubscribe", docket_alert_first.secret_key],
-            )
+        subscribe_url = reverse(
+            "toggle_docket_alert_confirmation",
+            args=["subscribe", docket_alert_first.secret_key],
         )
-        await self.async_client.post(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["unsubscribe", docket_alert_first.secret_key],
-            ),
-            {},
+        unsubscribe_url = reverse(
+            "toggle_docket_alert_confirmation",
+            args=["unsubscribe", docket_alert_first.secret_key],
         )
+
+        # Unauthenticated user tries to unsubscribe via GET and POST
+        await self.async_client.get(unsubscribe_url)
+        await self.async_client.post(unsubscribe_url, {})
         # The DocketAlert should remain in Subscription type.
         await docket_alert_first.arefresh_from_db()
         self.assertEqual(
@@ -1263,19 +1241,8 @@ class RecapEmailDocketAlerts(TestCase):
         # Update the DocketAlert to Unsubscription type
         await docket_alert.aupdate(alert_type=DocketAlert.UNSUBSCRIPTION)
         # Unauthenticated user tries to subscribe via GET and POST
-        await self.async_client.get(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["subscribe", docket_alert_first.secret_key],
-            )
-        )
-        await self.async_client.post(
-            reverse(
-                "toggle_docket_alert_confirmation",
-                args=["subscribe", docket_alert_first.secret_key],
-            ),
-            {},
-        )
+        await self.async_client.get(subscribe_url)
+        await self.async_client.post(subscribe_url, {})
         # The DocketAlert should remain in unsubscription type.
         await docket_alert_first.arefresh_from_db()
         self.assertEqual(
@@ -1353,12 +1320,15 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Subscription type, since user has
         # auto-subscribe True.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
-            "docket_entry__docket"
-        )
-        self.assertEqual(await recap_document.acount(), 10)
+        recap_documents = [
+            rd
+            async for rd in RECAPDocument.objects.select_related(
+                "docket_entry__docket"
+            ).order_by("pk")
+        ]
+        self.assertEqual(len(recap_documents), 10)
 
-        recap_document_first = await recap_document.afirst()
+        recap_document_first = recap_documents[0]
         docket = recap_document_first.docket_entry.docket
         docket_alert = DocketAlert.objects.filter(
             user=self.recipient_user.user,
@@ -1383,14 +1353,10 @@ class RecapEmailDocketAlerts(TestCase):
         )
         content = webhook_triggered_first.content
         # Compare the content of the webhook to the recap document
-        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
-            "pacer_doc_id"
-        ]
         recap_documents_webhook = content["payload"]["results"][0][
             "recap_documents"
         ]
-        await recap_document_first.arefresh_from_db()
-        self.assertEqual(recap_document_first.pacer_doc_id, pacer_doc_id)
+        self.assert_webhook_content_matches_rd(content, recap_document_first)
         # Document available from magic link, not sealed.
         self.assertEqual(recap_document_first.is_sealed, False)
         # We should send 10 recap documents in this webhook example
@@ -1429,7 +1395,7 @@ class RecapEmailDocketAlerts(TestCase):
         await self.async_client.post(self.path, self.data_4, format="json")
 
         # No new recap documents should be added.
-        self.assertEqual(await recap_document.acount(), 10)
+        self.assertEqual(await RECAPDocument.objects.acount(), 10)
 
         # No new docket alert or webhooks should be triggered.
         self.assertEqual(len(mail.outbox), 1)
@@ -1516,13 +1482,15 @@ class RecapEmailDocketAlerts(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_5, format="json")
+        await self.async_client.post(
+            self.path, self.data_5, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
 
         # Compare the NDA docket and recap document metadata
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -1570,7 +1538,9 @@ class RecapEmailDocketAlerts(TestCase):
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
         # auto-subscription option enabled
-        await self.async_client.post(self.path, self.data_5, format="json")
+        await self.async_client.post(
+            self.path, self.data_5, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
@@ -1578,7 +1548,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Subscription type, since user has
         # auto-subscribe True.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -1606,11 +1576,8 @@ class RecapEmailDocketAlerts(TestCase):
         )
         content = webhook_triggered_first.content
         # Compare the content of the webhook to the recap document
-        pacer_doc_id = content["payload"]["results"][0]["recap_documents"][0][
-            "pacer_doc_id"
-        ]
         await recap_document_first.arefresh_from_db()
-        self.assertEqual(recap_document_first.pacer_doc_id, pacer_doc_id)
+        self.assert_webhook_content_matches_rd(content, recap_document_first)
 
     @mock.patch(
         "cl.recap.tasks.download_pdf_by_magic_number",
@@ -1648,7 +1615,9 @@ class RecapEmailDocketAlerts(TestCase):
         # auto-subscription option disabled
         self.recipient_user.auto_subscribe = False
         await self.recipient_user.asave()
-        await self.async_client.post(self.path, self.data_5, format="json")
+        await self.async_client.post(
+            self.path, self.data_5, content_type="application/json"
+        )
 
         # Can we get the recap.email recipient properly?
         email_processing = EmailProcessingQueue.objects.all()
@@ -1657,7 +1626,7 @@ class RecapEmailDocketAlerts(TestCase):
         # A DocketAlert should be created when receiving the first notification
         # for this case with Unsubscription type, since user has the
         # auto-subscribe False.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         recap_document_first = await recap_document.afirst()
@@ -1720,7 +1689,7 @@ class RecapEmailDocketAlerts(TestCase):
         # Trigger a new nda recap.email notification from testing_1@recap.email
         # Multi Docket NEF.
         await self.async_client.post(
-            self.path, self.data_multi_jpml, format="json"
+            self.path, self.data_multi_jpml, content_type="application/json"
         )
 
         email_processing = EmailProcessingQueue.objects.all()
@@ -1748,31 +1717,37 @@ class RecapEmailDocketAlerts(TestCase):
         )
 
         # Compare the docket and recap document metadata
-        dockets = Docket.objects.all()
-        self.assertEqual(await dockets.acount(), 3)
-
-        case_names = [docket.case_name async for docket in dockets]
+        dockets = [
+            docket
+            async for docket in Docket.objects.values_list(
+                "case_name", "docket_number"
+            )
+        ]
+        self.assertEqual(len(dockets), 3)
+        case_names = [case_name for case_name, _ in dockets]
         # Check that all the case names are different between them
         self.assertTrue(len(set(case_names)) == len(case_names))
 
-        docket_numbers = [docket.docket_number async for docket in dockets]
+        docket_numbers = [docket_number for _, docket_number in dockets]
         # Check that all the docket_numbers are different between them
         self.assertTrue(len(set(docket_numbers)) == len(docket_numbers))
 
-        docket_entries = DocketEntry.objects.all()
-        self.assertEqual(await docket_entries.acount(), 3)
         docket_entry_numbers = [
-            docket_entry.entry_number async for docket_entry in docket_entries
+            entry_number
+            async for entry_number in DocketEntry.objects.values_list(
+                "entry_number", flat=True
+            )
         ]
+        self.assertEqual(len(docket_entry_numbers), 3)
         # Check that all the docket_entry_numbers are different between them
         self.assertTrue(
             len(set(docket_entry_numbers)) == len(docket_entry_numbers)
         )
 
-        recap_documents = RECAPDocument.objects.all()
-        self.assertEqual(await recap_documents.acount(), 6)
+        recap_documents = [rd async for rd in RECAPDocument.objects.all()]
+        self.assertEqual(len(recap_documents), 6)
 
-        async for rd in recap_documents:
+        for rd in recap_documents:
             # Every RECAPDocument should have a file stored at this point.
             self.assertTrue(rd.filepath_local)
             if not rd.attachment_number:
@@ -1793,62 +1768,48 @@ class RecapEmailDocketAlerts(TestCase):
 
         # 3 Webhook events should be triggered
         webhook_triggered = WebhookEvent.objects.filter(webhook=self.webhook)
-        # Does the webhook was triggered?
-        self.assertEqual(await webhook_triggered.acount(), 3)
-        async for webhook_event in webhook_triggered:
-            self.assertEqual(
-                webhook_event.event_status, WEBHOOK_EVENT_STATUS.SUCCESSFUL
+        webhook_events = [
+            webhook_event
+            async for webhook_event in webhook_triggered.values_list(
+                "event_status", "content"
             )
-
-        webhook_entry_numbers = [
-            webhook.content["payload"]["results"][0]["entry_number"]
-            async for webhook in webhook_triggered
         ]
-        # Check that all the webhook entry numbers are different between them
-        self.assertTrue(
-            len(set(webhook_entry_numbers)) == len(webhook_entry_numbers)
-        )
-
-        webhook_document_numbers = [
-            webhook.content["payload"]["results"][0]["recap_documents"][0][
-                "document_number"
-            ]
-            async for webhook in webhook_triggered
-        ]
-        # Check that all the webhook_document_numbers are different between
-        # them
-        self.assertTrue(
-            len(set(webhook_document_numbers)) == len(webhook_document_numbers)
-        )
-
-        webhook_att_document_numbers = [
-            webhook.content["payload"]["results"][0]["recap_documents"][1][
-                "document_number"
-            ]
-            async for webhook in webhook_triggered
-        ]
-        # Check that all the webhook_att_document_numbers are different between
-        # them
-        self.assertTrue(
-            len(set(webhook_att_document_numbers))
-            == len(webhook_att_document_numbers)
-        )
+        # Does the webhook was triggered?
+        self.assertEqual(len(webhook_events), 3)
+        for event_status, _ in webhook_events:
+            self.assertEqual(event_status, WEBHOOK_EVENT_STATUS.SUCCESSFUL)
+
+        webhook_numbers = []
+        for _, content in webhook_events:
+            result = content["payload"]["results"][0]
+            webhook_numbers.append(
+                (
+                    result["entry_number"],
+                    result["recap_documents"][0]["document_number"],
+                    result["recap_documents"][1]["document_number"],
+                )
+            )
+        # Check that the entry numbers, document numbers and attachment
+        # document numbers are different between the webhooks.
+        for numbers in zip(*webhook_numbers):
+            self.assertEqual(len(set(numbers)), len(numbers))
 
         # Check that all the PQ objects created are marked as SUCCESSFUL and
         # filepath_local deleted.
-        pqs = ProcessingQueue.objects.all()
-        async for pq in pqs:
-            self.assertEqual(pq.status, PROCESSING_STATUS.SUCCESSFUL)
-            self.assertFalse(pq.filepath_local)
+        self.assertFalse(
+            await ProcessingQueue.objects.exclude(
+                status=PROCESSING_STATUS.SUCCESSFUL, filepath_local=""
+            ).aexists()
+        )
 
         # Trigger the recap.email notification again for the same user, it
         # should be processed.
         await self.async_client.post(
-            self.path, self.data_multi_jpml, format="json"
+            self.path, self.data_multi_jpml, content_type="application/json"
         )
 
         # No new recap documents should be added.
-        self.assertEqual(len(recap_documents), 6)
+        self.assertEqual(await RECAPDocument.objects.acount(), 6)
 
         # No new docket alert or webhooks should be triggered.
         self.assertEqual(len(mail.outbox), 3)
@@ -1902,7 +1863,7 @@ class RecapEmailDocketAlerts(TestCase):
             ["testing_1@recap.email"],
         )
 
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -1971,7 +1932,9 @@ class RecapEmailDocketAlerts(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_5, format="json")
+        await self.async_client.post(
+            self.path, self.data_5, content_type="application/json"
+        )
 
         recap_document = RECAPDocument.objects.all()
         self.assertEqual(await recap_document.acount(), 1)
@@ -2116,7 +2079,7 @@ class RecapEmailDocketAlerts(TestCase):
             await self.async_client.post(self.path, self.data, format="json")
 
         # Compare docket entry data.
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry__docket"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -2518,7 +2481,7 @@ class RecapEmailDocketAlerts(TestCase):
         self.assertEqual(await dockets.acount(), 2)
         docket_entries = DocketEntry.objects.all()
         self.assertEqual(await docket_entries.acount(), 2)
-        recap_documents = RECAPDocument.objects.all().prefetch_related(
+        recap_documents = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_documents.acount(), 2)
@@ -2586,7 +2549,7 @@ class RecapEmailDocketAlerts(TestCase):
         docket_entries = DocketEntry.objects.all()
         # Two docket entries should be merged. One for each docket.
         self.assertEqual(await docket_entries.acount(), 2)
-        recap_documents = RECAPDocument.objects.all().prefetch_related(
+        recap_documents = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         # There are two RECAP documents, one for each docket.
@@ -2629,56 +2592,64 @@ class GetAndCopyRecapAttachments(TestCase):
     @classmethod
     def setUpTestData(cls):
         cls.user = User.objects.get(username="recap-email")
-        cls.d_1 = Docket.objects.create(
-            source=0, court_id="scotus", pacer_case_id="12345"
-        )
-        cls.d_2 = Docket.objects.create(
-            source=0, court_id="scotus", pacer_case_id="12345-1"
+        cls.d_1, cls.d_2, cls.d_3 = Docket.objects.bulk_create(
+            [
+                Docket(source=0, court_id="scotus", pacer_case_id=case_id)
+                for case_id in ["12345", "12345-1", "12345-2"]
+            ]
         )
-        cls.d_3 = Docket.objects.create(
-            source=0, court_id="scotus", pacer_case_id="12345-2"
+        des = DocketEntry.objects.bulk_create(
+            [
+                DocketEntry(docket=d, entry_number=1)
+                for d in [cls.d_1, cls.d_2, cls.d_3]
+            ]
         )
-        de_1_1 = DocketEntry.objects.create(docket=cls.d_1, entry_number=1)
-        de_2_1 = DocketEntry.objects.create(docket=cls.d_2, entry_number=1)
-        de_3_1 = DocketEntry.objects.create(docket=cls.d_3, entry_number=1)
 
-        des = [de_1_1, de_2_1, de_3_1]
-        cls.rds_att = []
+        rds = []
         for de in des:
             # Create main RDs
-            RECAPDocument.objects.create(
-                docket_entry=de,
-                document_number="1",
-                pacer_doc_id="04505578698",
-                document_type=RECAPDocument.PACER_DOCUMENT,
+            rds.append(
+                RECAPDocument(
+                    docket_entry=de,
+                    document_number="1",
+                    pacer_doc_id="04505578698",
+                    document_type=RECAPDocument.PACER_DOCUMENT,
+                )
             )
-
             # Create two attachments for each RD.
-            rd_att_1 = RECAPDocument.objects.create(
-                docket_entry=de,
-                pacer_doc_id="04505578699",
-                document_number="1",
-                attachment_number=1,
-                document_type=RECAPDocument.ATTACHMENT,
-            )
-            rd_att_2 = RECAPDocument.objects.create(
-                docket_entry=de,
-                pacer_doc_id="04505578700",
-                document_number="1",
-                attachment_number=2,
-                document_type=RECAPDocument.ATTACHMENT,
-            )
+            for attachment_number, pacer_doc_id in [
+                (1, "04505578699"),
+                (2, "04505578700"),
+            ]:
+                rds.append(
+                    RECAPDocument(
+                        docket_entry=de,
+                        pacer_doc_id=pacer_doc_id,
+                        document_number="1",
+                        attachment_number=attachment_number,
+                        document_type=RECAPDocument.ATTACHMENT,
+                    )
+                )
+        rds = RECAPDocument.objects.bulk_create(rds)
+        cls.rds_att = [rd for rd in rds if rd.attachment_number]
 
-            cls.rds_att.append(rd_att_1)
-            cls.rds_att.append(rd_att_2)
+    @staticmethod
+    def stored_attachment_hashes() -> list[tuple[int, str]]:
+        """Get the attachment number and SHA1 of every attachment RD that has
+        a file stored, computed when the file was copied to the RD.
+        """
+        return list(
+            RECAPDocument.objects.filter(attachment_number__isnull=False)
+            .exclude(filepath_local="")
+            .values_list("attachment_number", "sha1")
+        )
 
     def test_copy_pdf_attachments_from_pqs(self):
         """This test verifies that we can properly copy a PDF attachment from a
         PQ object to its corresponding RECAPDocument.
         """
 
-        rds = RECAPDocument.objects.all()
-        self.assertEqual(len(rds), 9)
+        self.assertEqual(RECAPDocument.objects.count(), 9)
 
         pq_att1 = ProcessingQueue.objects.create(
             court_id="scotus",
@@ -2715,23 +2686,22 @@ class GetAndCopyRecapAttachments(TestCase):
             self.user.pk,
         )
 
-        rds_all = RECAPDocument.objects.all()
-        for rd in rds_all:
-            if rd.attachment_number == 1:
-                with rd.filepath_local.open(mode="rb") as local_path:
-                    self.assertEqual(local_path.read(), b"Hello World att 1")
-            elif rd.attachment_number == 2:
-                with rd.filepath_local.open(mode="rb") as local_path:
-                    self.assertEqual(local_path.read(), b"Hello World att 2")
+        # Every attachment got a file with the content of its PQ.
+        self.assertEqual(
+            sorted(self.stored_attachment_hashes()),
+            [(1, sha1(att1_content))] * 3 + [(2, sha1(att2_content))] * 3,
+        )
 
         # After successfully copying the attachment document from the PQ object
         # check if the PQ object is marked as successful and the file is deleted
-        pqs = ProcessingQueue.objects.all()
+        pqs = ProcessingQueue.objects.exclude(status=PROCESSING_STATUS.FAILED)
         for pq in pqs:
-            if pq.status != PROCESSING_STATUS.FAILED:
-                async_to_sync(mark_pq_successful)(pq)
-            self.assertEqual(pq.status, PROCESSING_STATUS.SUCCESSFUL)
-            self.assertFalse(pq.filepath_local)
+            async_to_sync(mark_pq_successful)(pq)
+        self.assertFalse(
+            ProcessingQueue.objects.exclude(
+                status=PROCESSING_STATUS.SUCCESSFUL, filepath_local=""
+            ).exists()
+        )
 
     @mock.patch(
         "cl.recap.tasks.get_pacer_cookie_from_cache",
@@ -2754,8 +2724,7 @@ class GetAndCopyRecapAttachments(TestCase):
         attachment from the PQ object to its corresponding RECAPDocument.
         """
 
-        rds = RECAPDocument.objects.all()
-        self.assertEqual(len(rds), 9)
+        self.assertEqual(RECAPDocument.objects.count(), 9)
         get_and_copy_recap_attachment_docs(
             self,
             self.rds_att,
@@ -2764,27 +2733,23 @@ class GetAndCopyRecapAttachments(TestCase):
             "12345",
             self.user.pk,
         )
-        rds_all = RECAPDocument.objects.all()
-        for rd in rds_all:
-            if rd.attachment_number == 1:
-                with rd.filepath_local.open(mode="rb") as local_path:
-                    self.assertEqual(
-                        local_path.read(), b"Hello World from magic"
-                    )
-            elif rd.attachment_number == 2:
-                with rd.filepath_local.open(mode="rb") as local_path:
-                    self.assertEqual(
-                        local_path.read(), b"Hello World from magic"
-                    )
+        # Every attachment got a file with the content from the magic link.
+        magic_sha1 = sha1(b"Hello World from magic")
+        self.assertEqual(
+            sorted(self.stored_attachment_hashes()),
+            [(1, magic_sha1)] * 3 + [(2, magic_sha1)] * 3,
+        )
 
         # After successfully copying the attachment document from the PQ object
         # check if the PQ object is marked as successful and the file is deleted
-        pqs = ProcessingQueue.objects.all()
+        pqs = ProcessingQueue.objects.exclude(status=PROCESSING_STATUS.FAILED)
         for pq in pqs:
-            if pq.status != PROCESSING_STATUS.FAILED:
-                async_to_sync(mark_pq_successful)(pq)
-            self.assertEqual(pq.status, PROCESSING_STATUS.SUCCESSFUL)
-            self.assertFalse(pq.filepath_local)
+            async_to_sync(mark_pq_successful)(pq)
+        self.assertFalse(
+            ProcessingQueue.objects.exclude(
+                status=PROCESSING_STATUS.SUCCESSFUL, filepath_local=""
+            ).exists()
+        )
 
 
 @mock.patch(
@@ -2809,59 +2774,58 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.court_ca9 = CourtFactory(id="ca9", jurisdiction="F")
-        cls.court_ca11 = CourtFactory(id="ca11", jurisdiction="F")
-        cls.court_ca2 = CourtFactory(id="ca2", jurisdiction="F")
-        cls.court_ca8 = CourtFactory(id="ca8", jurisdiction="F")
-        test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
-        with (
-            open(
-                test_dir / "recap_mail_custom_receipt_nda.json",
-                encoding="utf-8",
-            ) as nda_file,
-            open(
-                test_dir / "recap_mail_custom_receipt_nda_ca11.json",
-                encoding="utf-8",
-            ) as ca11_file,
-            open(
-                test_dir / "recap_mail_custom_receipt_nda_ca2.json",
-                encoding="utf-8",
-            ) as ca2_file,
-            open(
-                test_dir / "recap_mail_custom_receipt_nda_ca8.json",
-                encoding="utf-8",
-            ) as ca8_file,
-        ):
-            recap_mail_receipt_nda = json.load(nda_file)
-            recap_mail_receipt_nda_ca11 = json.load(ca11_file)
-            recap_mail_receipt_nda_ca2 = json.load(ca2_file)
-            recap_mail_receipt_nda_ca8 = json.load(ca8_file)
-        cls.data_ca9 = {
-            "court": cls.court_ca9.id,
-            "mail": recap_mail_receipt_nda["mail"],
-            "receipt": recap_mail_receipt_nda["receipt"],
-        }
-        cls.data_ca11 = {
-            "court": cls.court_ca11.id,
-            "mail": recap_mail_receipt_nda_ca11["mail"],
-            "receipt": recap_mail_receipt_nda_ca11["receipt"],
-        }
-        cls.data_ca2 = {
-            "court": cls.court_ca2.id,
-            "mail": recap_mail_receipt_nda_ca2["mail"],
-            "receipt": recap_mail_receipt_nda_ca2["receipt"],
-        }
-        cls.data_ca8 = {
-            "court": cls.court_ca8.id,
-            "mail": recap_mail_receipt_nda_ca8["mail"],
-            "receipt": recap_mail_receipt_nda_ca8["receipt"],
-        }
+        cls.court_ca9, cls.court_ca11, cls.court_ca2, cls.court_ca8 = [
+            CourtFactory(id=court_id, jurisdiction="F")
+            for court_id in ["ca9", "ca11", "ca2", "ca8"]
+        ]
+        recap_mail_receipt_nda = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda.json"
+        )
+        recap_mail_receipt_nda_ca11 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda_ca11.json"
+        )
+        recap_mail_receipt_nda_ca2 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda_ca2.json"
+        )
+        recap_mail_receipt_nda_ca8 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda_ca8.json"
+        )
+        cls.data_ca9 = json.dumps(
+            {
+                "court": cls.court_ca9.id,
+                "mail": recap_mail_receipt_nda["mail"],
+                "receipt": recap_mail_receipt_nda["receipt"],
+            }
+        )
+        cls.data_ca11 = json.dumps(
+            {
+                "court": cls.court_ca11.id,
+                "mail": recap_mail_receipt_nda_ca11["mail"],
+                "receipt": recap_mail_receipt_nda_ca11["receipt"],
+            }
+        )
+        cls.data_ca2 = json.dumps(
+            {
+                "court": cls.court_ca2.id,
+                "mail": recap_mail_receipt_nda_ca2["mail"],
+                "receipt": recap_mail_receipt_nda_ca2["receipt"],
+            }
+        )
+        cls.data_ca8 = json.dumps(
+            {
+                "court": cls.court_ca8.id,
+                "mail": recap_mail_receipt_nda_ca8["mail"],
+                "receipt": recap_mail_receipt_nda_ca8["receipt"],
+            }
+        )
+        user = User.objects.select_related("auth_token").get(
+            username="recap-email"
+        )
+        cls.token = f"Token {user.auth_token.key}"
 
     def setUp(self) -> None:
         self.async_client = AsyncAPIClient()
-        self.user = User.objects.get(username="recap-email")
-        token = f"Token {self.user.auth_token.key}"
-        self.async_client.credentials(HTTP_AUTHORIZATION=token)
+        self.async_client.credentials(HTTP_AUTHORIZATION=self.token)
         self.path = "/api/rest/v3/recap-email/"
 
     @mock.patch(
@@ -2887,13 +2851,15 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca9, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca9, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
 
         # Compare the NDA docket and recap document metadata
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -2932,13 +2898,15 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca11, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca11, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
 
         # Compare the NDA docket and recap document metadata
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -2980,13 +2948,15 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca2, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca2, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
 
         # Compare the NDA docket and recap document metadata
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -3021,11 +2991,13 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca8, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca8, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -3059,7 +3031,9 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca11, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca11, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
@@ -3071,7 +3045,9 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         self.assertEqual(await docket_entry.acount(), 1)
 
         # Trigger a new nda recap.email notification for the same case/document
-        await self.async_client.post(self.path, self.data_ca11, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca11, content_type="application/json"
+        )
         recap_document_2 = RECAPDocument.objects.all()
         docket_entry_2 = DocketEntry.objects.all()
         # No duplicated docket entries and recap documents
@@ -3109,11 +3085,13 @@ class GetDocumentNumberForAppellateDocuments(TestCase):
         """
 
         # Trigger a new nda recap.email notification from testing_1@recap.email
-        await self.async_client.post(self.path, self.data_ca2, format="json")
+        await self.async_client.post(
+            self.path, self.data_ca2, content_type="application/json"
+        )
 
         email_processing = EmailProcessingQueue.objects.all()
         self.assertEqual(await email_processing.acount(), 1)
-        recap_document = RECAPDocument.objects.all().prefetch_related(
+        recap_document = RECAPDocument.objects.all().select_related(
             "docket_entry"
         )
         self.assertEqual(await recap_document.acount(), 1)
@@ -3158,14 +3136,9 @@ class RecapEmailContentReplication(TestCase):
         cls.user_profile = UserProfileWithParentsFactory()
         cls.court_canb = CourtFactory(id="canb", jurisdiction="FB")
 
-        test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
-        with (
-            open(
-                test_dir / "recap_mail_custom_receipt_multi_nef_jpml.json",
-                encoding="utf-8",
-            ) as file_jpml,
-        ):
-            recap_mail_receipt_multi_nef_jpml = json.load(file_jpml)
+        recap_mail_receipt_multi_nef_jpml = load_recap_email_fixture(
+            "recap_mail_custom_receipt_multi_nef_jpml.json"
+        )
 
         cls.data_multi_canb = {
             "court": cls.court_canb.id,
@@ -3207,7 +3180,7 @@ class RecapEmailContentReplication(TestCase):
 
         recipient_user = self.user_profile
         recipient_user.user.email = "testing_1@mail.com"
-        recipient_user.user.password = make_password("password")
+        recipient_user.user.password = TEST_PASSWORD_HASH
         recipient_user.user.save()
         recipient_user.recap_email = "testing_1@recap.email"
         recipient_user.auto_subscribe = True
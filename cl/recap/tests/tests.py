@@ -2,6 +2,7 @@ import json
 import os
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from http import HTTPStatus
 from pathlib import Path
 from unittest import mock
@@ -39,9 +40,15 @@ from cl.api.management.commands.cl_retry_webhooks import (
 )
 from cl.api.models import Webhook, WebhookEvent, WebhookEventType
 from cl.api.utils import (
+    WEBHOOK_RETRY_DELAYS,
+    WEBHOOK_RETRY_JITTER,
     get_next_webhook_retry_date,
     get_webhook_deprecation_date,
 )
+from cl.api.webhooks import (
+    WEBHOOK_MAX_CONCURRENT_REQUESTS,
+    send_webhook_events,
+)
 from cl.corpus_importer.utils import is_appellate_court
 from cl.lib.pacer import is_pacer_court_accessible, lookup_and_save
 from cl.lib.recap_utils import needs_ocr
@@ -154,6 +161,9 @@ from cl.users.factories import (
     UserWithChildProfileFactory,
 )
 
+# Hash the shared test password once instead of in every setUp.
+TEST_PASSWORD_HASH = make_password("password")
+
 
 class RecapUtilsTest(TestCase):
 
@@ -1375,7 +1385,7 @@ class ReplicateRecapUploadsTest(TestCase):
     def setUpTestData(cls):
         user_profile = UserProfileWithParentsFactory.create(
             user__username="pandora",
-            user__password=make_password("password"),
+            user__password=TEST_PASSWORD_HASH,
         )
         cls.user = user_profile.user
         permissions = Permission.objects.filter(
@@ -3445,14 +3455,35 @@ def mock_bucket_open(message_id, r, read_file=False):
     """This function mocks bucket.open() method in order to call a
     recap.email notification fixture.
     """
-    test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
     if read_file:
-        with open(test_dir / message_id, "rb") as file:
-            return file.read()
+        return read_recap_test_asset(message_id)
+    test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
     recap_mail_example = open(test_dir / message_id, "rb")
     return recap_mail_example
 
 
+@lru_cache(maxsize=None)
+def read_recap_test_asset(filename: str) -> bytes:
+    """Read a file from the recap test assets.
+
+    The content is cached, so mocks that return the same fixture many times
+    only hit the disk once.
+    """
+    test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
+    return (test_dir / filename).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def load_recap_email_fixture(filename: str) -> dict:
+    """Load and parse a recap.email JSON fixture from the test assets.
+
+    The parsed fixture is cached and shared between test classes, so it must
+    not be mutated. Assign it to class attributes in setUpTestData, which are
+    deep-copied for every test.
+    """
+    return json.loads(read_recap_test_asset(filename))
+
+
 class DebugRecapUploadtest(TestCase):
     """Test uploads with debug set to True. Do these uploads avoid causing
     problems?
@@ -5607,17 +5638,18 @@ class TestRecapDocumentsExtractContentCommand(TestCase):
     extraction.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.file_content = mock_bucket_open(
+            "gov.uscourts.ca1.12-2209.00106475093.0.pdf", "rb", True
+        )
+        cls.filename = "file_2.pdf"
+
     def setUp(self) -> None:
         d = Docket.objects.create(
             source=0, court_id="scotus", pacer_case_id="asdf"
         )
         self.de = DocketEntry.objects.create(docket=d, entry_number=1)
-        self.user = User.objects.get(username="recap")
-        file_content = mock_bucket_open(
-            "gov.uscourts.ca1.12-2209.00106475093.0.pdf", "rb", True
-        )
-        self.filename = "file_2.pdf"
-        self.file_content = file_content
 
     def test_extract_missed_recap_documents(self):
         """Can we extract only recap documents that need content extraction?"""
@@ -5674,7 +5706,7 @@ class TestRecapDocumentsExtractContentCommand(TestCase):
 
     @mock.patch(
         "django.db.models.fields.files.FieldFile.open",
-        side_effect=lambda mode: exec("raise FileNotFoundError"),
+        side_effect=FileNotFoundError,
     )
     def test_clean_up_recap_document_file(self, mock_open):
         """Can we clean up the recap document file-related fields after a
@@ -5710,23 +5742,26 @@ class TestRecapDocumentsExtractContentCommand(TestCase):
         self.assertEqual(rd[0].date_upload, None)
 
 
+COURT_CONNECTIVITY_CHECK_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 @mock.patch("cl.lib.pacer.socket.gethostbyname", return_value="127.0.0.1")
 class CheckCourtConnectivityTest(TestCase):
     """Test the is_pacer_court_accessible method."""
 
     def setUp(self) -> None:
         self.court_id = "alnb"
-        self.r = get_redis_interface("CACHE")
-        key = self.r.keys(f"status:pacer:court.{self.court_id}:ip.127.0.0.1")
-        if key:
-            self.r.delete(*key)
+        # The key has no wildcards, so delete it directly instead of looking
+        # it up with KEYS, which scans the whole keyspace.
+        r = get_redis_interface("CACHE")
+        r.delete(f"status:pacer:court.{self.court_id}:ip.127.0.0.1")
 
     @mock.patch(
         "cl.lib.pacer.check_pacer_court_connectivity",
         side_effect=lambda x: {
             "connection_ok": True,
             "status_code": 200,
-            "date_time": datetime.now(timezone.utc),
+            "date_time": COURT_CONNECTIVITY_CHECK_TIME,
         },
     )
     def test_is_pacer_court_accessible_pass(
@@ -5740,7 +5775,7 @@ class CheckCourtConnectivityTest(TestCase):
         side_effect=lambda x: {
             "connection_ok": False,
             "status_code": 403,
-            "date_time": datetime.now(timezone.utc),
+            "date_time": COURT_CONNECTIVITY_CHECK_TIME,
         },
     )
     def test_is_pacer_court_accessible_fails(
@@ -5750,61 +5785,77 @@ class CheckCourtConnectivityTest(TestCase):
         self.assertEqual(court_status, False)
 
 
-@mock.patch("cl.recap.tasks.enqueue_docket_alert", return_value=True)
-@mock.patch(
-    "cl.recap.tasks.RecapEmailSESStorage.open",
-    side_effect=mock_bucket_open,
-)
-@mock.patch(
-    "cl.recap.tasks.get_or_cache_pacer_cookies",
-    side_effect=lambda x, y, z: (None, None),
-)
-@mock.patch(
-    "cl.recap.tasks.is_pacer_court_accessible",
-    side_effect=lambda a: True,
-)
-@mock.patch(
-    "cl.corpus_importer.tasks.get_document_number_from_confirmation_page",
-    side_effect=lambda z, x: "011112443447",
-)
-@mock.patch(
-    "cl.recap.tasks.is_docket_entry_sealed",
-    return_value=False,
-)
+# Delay before the first retry of a failed webhook event.
+WEBHOOK_FIRST_RETRY_DELAY = timedelta(minutes=3)
+
+
 class WebhooksRetries(TestCase):
     """Test WebhookEvents retries"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # None of these mocks is inspected by the tests, so patch them once
+        # for the whole class instead of around every test method.
+        for patcher in [
+            mock.patch(
+                "cl.recap.tasks.enqueue_docket_alert", return_value=True
+            ),
+            mock.patch(
+                "cl.recap.tasks.RecapEmailSESStorage.open",
+                side_effect=mock_bucket_open,
+            ),
+            mock.patch(
+                "cl.recap.tasks.get_or_cache_pacer_cookies",
+                side_effect=lambda x, y, z: (None, None),
+            ),
+            mock.patch(
+                "cl.recap.tasks.is_pacer_court_accessible",
+                side_effect=lambda a: True,
+            ),
+            mock.patch(
+                "cl.corpus_importer.tasks.get_document_number_from_confirmation_page",
+                side_effect=lambda z, x: "011112443447",
+            ),
+            mock.patch(
+                "cl.recap.tasks.is_docket_entry_sealed",
+                return_value=False,
+            ),
+            # Keep retry dates deterministic so tests can travel to them.
+            mock.patch("cl.api.utils.WEBHOOK_RETRY_JITTER", 0),
+        ]:
+            cls.enterClassContext(patcher)
+
     @classmethod
     def setUpTestData(cls):
-        cls.user_profile = UserProfileWithParentsFactory()
-        cls.user_profile_2 = UserProfileWithParentsFactory()
+        cls.user_profile = UserProfileWithParentsFactory(
+            user__email="testing_1@mail.com",
+            user__password=TEST_PASSWORD_HASH,
+            auto_subscribe=True,
+        )
+        # assign_recap_email replaces recap_email when the profile is
+        # created, so set the address the fixtures are sent to afterward.
+        cls.user_profile.recap_email = "testing_1@recap.email"
+        cls.user_profile.save(update_fields=["recap_email"])
         cls.court_nda = CourtFactory(id="ca9", jurisdiction="F")
         cls.court_nyed = CourtFactory(id="nyed", jurisdiction="FB")
-        cls.webhook = WebhookFactory(
-            user=cls.user_profile.user,
-            event_type=WebhookEventType.DOCKET_ALERT,
-            url="https://example.com/",
-            enabled=True,
+        cls.webhook, cls.webhook_disabled = Webhook.objects.bulk_create(
+            [
+                WebhookFactory.build(
+                    user=cls.user_profile.user,
+                    event_type=WebhookEventType.DOCKET_ALERT,
+                    url="https://example.com/",
+                    enabled=enabled,
+                )
+                for enabled in [True, False]
+            ]
         )
-        cls.webhook_disabled = WebhookFactory(
-            user=cls.user_profile.user,
-            event_type=WebhookEventType.DOCKET_ALERT,
-            url="https://example.com/",
-            enabled=False,
+        recap_mail_receipt_4 = load_recap_email_fixture(
+            "recap_mail_custom_receipt_4.json"
+        )
+        recap_mail_receipt_nda = load_recap_email_fixture(
+            "recap_mail_custom_receipt_nda.json"
         )
-        test_dir = Path(settings.INSTALL_ROOT) / "cl" / "recap" / "test_assets"
-        with (
-            open(
-                test_dir / "recap_mail_custom_receipt_4.json",
-                encoding="utf-8",
-            ) as file_4,
-            open(
-                test_dir / "recap_mail_custom_receipt_nda.json",
-                encoding="utf-8",
-            ) as file_5,
-        ):
-            recap_mail_receipt_4 = json.load(file_4)
-            recap_mail_receipt_nda = json.load(file_5)
 
         cls.data_nef_att = {
             "court": cls.court_nyed.id,
@@ -5827,15 +5878,6 @@ class WebhooksRetries(TestCase):
         self.async_client.credentials(HTTP_AUTHORIZATION=token)
         self.path = "/api/rest/v3/recap-email/"
 
-        recipient_user = self.user_profile
-        recipient_user.user.email = "testing_1@mail.com"
-        recipient_user.user.password = make_password("password")
-        recipient_user.user.save()
-        recipient_user.recap_email = "testing_1@recap.email"
-        recipient_user.auto_subscribe = True
-        recipient_user.save()
-        self.recipient_user = recipient_user
-
         self.r = get_redis_interface("CACHE")
 
     @classmethod
@@ -5845,15 +5887,7 @@ class WebhooksRetries(TestCase):
         if key:
             r.delete(*key)
 
-    def test_get_next_webhook_retry_date(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_get_next_webhook_retry_date(self):
         """Verifies if the WebhookEvent next retry date is computed properly
         based on the exponential backoff retry policy defined in cl.api.utils
         get_next_webhook_retry_date.
@@ -5882,15 +5916,44 @@ class WebhooksRetries(TestCase):
                 self.assertEqual(next_retry_date, expected_next_retry_date)
                 next_fake_time = next_retry_date
 
-    def test_retry_webhook_disabled(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_get_next_webhook_retry_date_jitter(self):
+        """Confirm the next retry date is jittered within
+        WEBHOOK_RETRY_JITTER of the backoff delay.
+        """
+        fake_now = now()
+        with (
+            time_machine.travel(fake_now, tick=False),
+            mock.patch("cl.api.utils.WEBHOOK_RETRY_JITTER", 0.1),
+        ):
+            for _ in range(20):
+                next_retry_date = get_next_webhook_retry_date(0)
+                self.assertGreaterEqual(
+                    next_retry_date, fake_now + timedelta(seconds=162)
+                )
+                self.assertLessEqual(
+                    next_retry_date, fake_now + timedelta(seconds=198)
+                )
+
+    def test_jittered_retry_schedule_fits_in_cut_off(self):
+        """Confirm an event that draws the maximum jitter on every retry
+        still reaches its last retry before HOURS_WEBHOOKS_CUT_OFF fails it.
+        """
+        max_delays = sum(
+            (
+                delay * (1 + WEBHOOK_RETRY_JITTER)
+                for delay in WEBHOOK_RETRY_DELAYS
+            ),
+            timedelta(),
+        )
+        # The retry command runs once a minute, so each retry can be
+        # attempted up to a minute after it's due.
+        polling_slack = timedelta(minutes=len(WEBHOOK_RETRY_DELAYS))
+        self.assertLess(
+            max_delays + polling_slack,
+            timedelta(hours=HOURS_WEBHOOKS_CUT_OFF),
+        )
+
+    def test_retry_webhook_disabled(self):
         """This test checks if WebhookEvent that its parent Webhook is disabled
         it won't be retried.
         """
@@ -5899,7 +5962,7 @@ class WebhooksRetries(TestCase):
             webhook=self.webhook_disabled,
             content="{'message': 'ok_1'}",
             event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
+            next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
         )
         with mock.patch(
             "cl.api.webhooks.requests.post",
@@ -5908,7 +5971,7 @@ class WebhooksRetries(TestCase):
             ),
         ):
             # Try to retry on the exact time, 3 minutes later.
-            next_retry_date = fake_now + timedelta(minutes=3)
+            next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 with mock.patch("cl.api.webhooks.send_webhook_event"):
                     # webhook_e1 shouldn't be retried since its parent webhook
@@ -5916,49 +5979,45 @@ class WebhooksRetries(TestCase):
                     retried_webhooks = retry_webhook_events()
                     self.assertEqual(retried_webhooks, 0)
 
-    def test_retry_webhook_events(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_retry_webhook_events(self):
         """This test checks if only a WebhookEvent in ENQUEUED_RETRY status and
         if its next_retry_date is equal to or lower than now can be retried.
         """
         fake_now = now()
-        webhook_e1 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_1'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
-        )
-        webhook_e1_debug = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_1'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
-            debug=True,
-        )
-        webhook_e2 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_2'}",
-            event_status=WEBHOOK_EVENT_STATUS.SUCCESSFUL,
-            next_retry_date=fake_now + timedelta(minutes=3),
-        )
-        webhook_e3 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_3'}",
-            event_status=WEBHOOK_EVENT_STATUS.IN_PROGRESS,
-            next_retry_date=fake_now + timedelta(minutes=3),
-        )
-        webhook_e4 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_4'}",
-            event_status=WEBHOOK_EVENT_STATUS.FAILED,
-            next_retry_date=fake_now + timedelta(minutes=3),
+        webhook_e1, *_ = WebhookEvent.objects.bulk_create(
+            [
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content="{'message': 'ok_1'}",
+                    event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                ),
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content="{'message': 'ok_1'}",
+                    event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                    debug=True,
+                ),
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content="{'message': 'ok_2'}",
+                    event_status=WEBHOOK_EVENT_STATUS.SUCCESSFUL,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                ),
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content="{'message': 'ok_3'}",
+                    event_status=WEBHOOK_EVENT_STATUS.IN_PROGRESS,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                ),
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content="{'message': 'ok_4'}",
+                    event_status=WEBHOOK_EVENT_STATUS.FAILED,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                ),
+            ]
         )
 
         with mock.patch(
@@ -5970,17 +6029,17 @@ class WebhooksRetries(TestCase):
             next_retry_date = fake_now + timedelta(minutes=1)
             with time_machine.travel(next_retry_date, tick=False):
                 with mock.patch(
-                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_event"
+                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_events"
                 ):
                     webhooks_to_retry = retry_webhook_events()
                     # No webhooks events should be retried since it's no time.
                     self.assertEqual(webhooks_to_retry, 0)
 
             # Try to retry on the exact time, 3 minutes later.
-            next_retry_date = fake_now + timedelta(minutes=3)
+            next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 with mock.patch(
-                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_event"
+                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_events"
                 ):
                     # Only webhook_e1 should be retried.
                     webhooks_to_retry = retry_webhook_events()
@@ -5990,7 +6049,7 @@ class WebhooksRetries(TestCase):
             next_retry_date = fake_now + timedelta(minutes=5)
             with time_machine.travel(next_retry_date, tick=False):
                 with mock.patch(
-                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_event"
+                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_events"
                 ):
                     # Only webhook_e1 should be retried.
                     webhooks_to_retry = retry_webhook_events()
@@ -6000,42 +6059,91 @@ class WebhooksRetries(TestCase):
             next_retry_date = fake_now + timedelta(hours=10)
             with time_machine.travel(next_retry_date, tick=False):
                 with mock.patch(
-                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_event"
+                    "cl.api.management.commands.cl_retry_webhooks.send_webhook_events"
                 ):
                     webhooks_to_retry = retry_webhook_events()
                     self.assertEqual(webhooks_to_retry, 1)
 
-            webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
-            # Retry without mocking send_webhook_event
+            # Retry without the send_webhook_events patch, so the event is
+            # actually sent.
             next_retry_date = fake_now + timedelta(minutes=10)
             with time_machine.travel(next_retry_date, tick=False):
                 webhooks_to_retry = retry_webhook_events()
                 self.assertEqual(webhooks_to_retry, 1)
+                webhook_e1.refresh_from_db(
+                    fields=["event_status", "status_code"]
+                )
                 self.assertEqual(
-                    webhook_e1_compare[0].event_status,
-                    WEBHOOK_EVENT_STATUS.SUCCESSFUL,
+                    webhook_e1.event_status, WEBHOOK_EVENT_STATUS.SUCCESSFUL
                 )
-                self.assertEqual(webhook_e1_compare[0].status_code, 200)
+                self.assertEqual(webhook_e1.status_code, 200)
 
-    def test_webhook_response_status_codes(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_send_webhook_events_concurrently(self):
+        """Can send_webhook_events deliver a batch of events concurrently and
+        update each event with the response to its own request?
+        """
+        webhook_events = WebhookEvent.objects.bulk_create(
+            [
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content=f"{{'message': 'ok_{i}'}}",
+                    event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    next_retry_date=now(),
+                )
+                for i in range(WEBHOOK_MAX_CONCURRENT_REQUESTS + 2)
+            ]
+        )
+        urls = [f"https://example.com/{i}" for i in range(len(webhook_events))]
+        events_by_url = {
+            url.replace("https://", "http://"): event
+            for url, event in zip(urls, webhook_events)
+        }
+
+        def fake_post(url, **kwargs):
+            # Fail every other event to check that each response is paired
+            # with the event it was sent for.
+            event = events_by_url[url]
+            self.assertEqual(
+                kwargs["headers"]["Idempotency-Key"], str(event.event_id)
+            )
+            status_code = 500 if webhook_events.index(event) % 2 else 200
+            return MockResponse(status_code, mock_raw=True)
+
+        with mock.patch(
+            "cl.api.webhooks.requests.post", side_effect=fake_post
+        ) as mock_post:
+            send_webhook_events(webhook_events, urls)
+
+        self.assertEqual(mock_post.call_count, len(webhook_events))
+        for i, webhook_event in enumerate(webhook_events):
+            with self.subTest(event=i):
+                webhook_event.refresh_from_db(
+                    fields=["event_status", "status_code"]
+                )
+                if i % 2:
+                    self.assertEqual(webhook_event.status_code, 500)
+                    self.assertEqual(
+                        webhook_event.event_status,
+                        WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    )
+                else:
+                    self.assertEqual(webhook_event.status_code, 200)
+                    self.assertEqual(
+                        webhook_event.event_status,
+                        WEBHOOK_EVENT_STATUS.SUCCESSFUL,
+                    )
+
+    def test_webhook_response_status_codes(self):
         """This test checks if a WebhookEvent is properly considered for retry
         or marked as successful based on the received HTTP status code.
         """
 
-        fake_now = now()
+        next_retry_date = now() + WEBHOOK_FIRST_RETRY_DELAY
         webhook_e1 = WebhookEventFactory(
             webhook=self.webhook,
             content="{'message': 'ok_1'}",
             event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
+            next_retry_date=next_retry_date,
         )
         status_codes_tests = [
             (100, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
@@ -6045,24 +6153,27 @@ class WebhooksRetries(TestCase):
             (500, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
         ]
         webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
-        for status_code, expected_event_status in status_codes_tests:
-            with mock.patch(
+        with (
+            time_machine.travel(next_retry_date, tick=False),
+            mock.patch(
                 "cl.api.webhooks.requests.post",
-                side_effect=lambda *args, **kwargs: MockResponse(
-                    status_code, raw=self.file_stream
-                ),
-            ):
-                next_retry_date = fake_now + timedelta(minutes=3)
-                with time_machine.travel(next_retry_date, tick=False):
+                side_effect=[
+                    MockResponse(code, raw=self.file_stream)
+                    for code, _ in status_codes_tests
+                ],
+            ),
+        ):
+            for status_code, expected_event_status in status_codes_tests:
+                with self.subTest(status_code=status_code):
                     webhooks_to_retry = retry_webhook_events()
                     self.assertEqual(webhooks_to_retry, 1)
+                    webhook_e1.refresh_from_db(fields=["event_status"])
                     self.assertEqual(
-                        webhook_e1_compare[0].event_status,
-                        expected_event_status,
+                        webhook_e1.event_status, expected_event_status
                     )
                     # Restore webhook event to test the remaining options
                     webhook_e1_compare.update(
-                        next_retry_date=webhook_e1.next_retry_date,
+                        next_retry_date=next_retry_date,
                         event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                     )
 
@@ -6072,12 +6183,6 @@ class WebhooksRetries(TestCase):
     )
     async def test_update_webhook_after_http_error(
         self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
         mock_download_pacer_pdf_by_rd,
     ):
         """This test verifies if a WebhookEvent is properly enqueued for retry
@@ -6101,12 +6206,15 @@ class WebhooksRetries(TestCase):
                 )
 
                 # Webhook should be triggered
-                webhook_triggered = WebhookEvent.objects.filter(
-                    webhook=self.webhook
-                ).prefetch_related("webhook")
+                webhook_triggered = [
+                    webhook_event
+                    async for webhook_event in WebhookEvent.objects.filter(
+                        webhook=self.webhook
+                    ).select_related("webhook")
+                ]
                 # Does the webhook was triggered?
-                self.assertEqual(await webhook_triggered.acount(), 1)
-                webhook_triggered_first = await webhook_triggered.afirst()
+                self.assertEqual(len(webhook_triggered), 1)
+                webhook_triggered_first = webhook_triggered[0]
                 content = webhook_triggered_first.content
                 # Compare the content of the webhook to the recap document
                 pacer_doc_id = content["payload"]["results"][0][
@@ -6124,7 +6232,7 @@ class WebhooksRetries(TestCase):
                 self.assertEqual(webhook_triggered_first.error_message, "")
 
                 # Is the webhook event updated for retry?
-                first_retry_time = fake_now_0 + timedelta(minutes=3)
+                first_retry_time = fake_now_0 + WEBHOOK_FIRST_RETRY_DELAY
                 self.assertEqual(
                     webhook_triggered_first.next_retry_date, first_retry_time
                 )
@@ -6144,12 +6252,6 @@ class WebhooksRetries(TestCase):
     )
     async def test_update_webhook_after_network_error(
         self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
         mock_download_pacer_pdf_by_rd,
     ):
         """This test verifies if a WebhookEvent is properly enqueued for retry
@@ -6158,9 +6260,7 @@ class WebhooksRetries(TestCase):
 
         with mock.patch(
             "cl.api.webhooks.requests.post",
-            side_effect=lambda *args, **kwargs: exec(
-                "raise ConnectionError('Connection Error')"
-            ),
+            side_effect=ConnectionError("Connection Error"),
         ):
             fake_now_0 = now()
             with time_machine.travel(fake_now_0, tick=False):
@@ -6171,12 +6271,15 @@ class WebhooksRetries(TestCase):
                 )
 
                 # Webhook should be triggered
-                webhook_triggered = WebhookEvent.objects.filter(
-                    webhook=self.webhook
-                ).prefetch_related("webhook")
+                webhook_triggered = [
+                    webhook_event
+                    async for webhook_event in WebhookEvent.objects.filter(
+                        webhook=self.webhook
+                    ).select_related("webhook")
+                ]
                 # Does the webhook was triggered?
-                self.assertEqual(await webhook_triggered.acount(), 1)
-                webhook_triggered_first = await webhook_triggered.afirst()
+                self.assertEqual(len(webhook_triggered), 1)
+                webhook_triggered_first = webhook_triggered[0]
                 content = webhook_triggered_first.content
                 # Compare the content of the webhook to the recap document
                 pacer_doc_id = content["payload"]["results"][0][
@@ -6197,7 +6300,7 @@ class WebhooksRetries(TestCase):
                 )
 
                 # Is the webhook event updated for retry?
-                first_retry_time = fake_now_0 + timedelta(minutes=3)
+                first_retry_time = fake_now_0 + WEBHOOK_FIRST_RETRY_DELAY
                 self.assertEqual(
                     webhook_triggered_first.next_retry_date, first_retry_time
                 )
@@ -6217,12 +6320,6 @@ class WebhooksRetries(TestCase):
     )
     async def test_success_webhook_delivery(
         self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
         mock_download_pacer_pdf_by_rd,
     ):
         """This test verifies if a WebhookEvent is properly updated after a
@@ -6244,12 +6341,15 @@ class WebhooksRetries(TestCase):
                 )
 
                 # Webhook should be triggered
-                webhook_triggered = WebhookEvent.objects.filter(
-                    webhook=self.webhook
-                ).prefetch_related("webhook")
+                webhook_triggered = [
+                    webhook_event
+                    async for webhook_event in WebhookEvent.objects.filter(
+                        webhook=self.webhook
+                    ).select_related("webhook")
+                ]
                 # Does the webhook was triggered?
-                self.assertEqual(await webhook_triggered.acount(), 1)
-                webhook_triggered_first = await webhook_triggered.afirst()
+                self.assertEqual(len(webhook_triggered), 1)
+                webhook_triggered_first = webhook_triggered[0]
                 content = webhook_triggered_first.content
                 # Compare the content of the webhook to the recap document
                 pacer_doc_id = content["payload"]["results"][0][
@@ -6283,12 +6383,6 @@ class WebhooksRetries(TestCase):
     )
     async def test_retry_webhooks_integration(
         self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
         mock_download_pacer_pdf_by_rd,
     ):
         """This test checks if a recap.email notification comes in and its
@@ -6303,7 +6397,7 @@ class WebhooksRetries(TestCase):
             ),
         ):
             fake_now_0 = now()
-            with time_machine.travel(fake_now_0, tick=False):
+            with time_machine.travel(fake_now_0, tick=False) as traveller:
                 # Trigger a new recap.email notification from testing_1@recap.email
                 # auto-subscription option enabled
                 await self.async_client.post(
@@ -6329,7 +6423,7 @@ class WebhooksRetries(TestCase):
                 )
                 self.assertNotEqual(webhook_triggered_first.event_id, "")
                 self.assertEqual(webhook_triggered_first.status_code, 500)
-                first_retry_time = fake_now_0 + timedelta(minutes=3)
+                first_retry_time = fake_now_0 + WEBHOOK_FIRST_RETRY_DELAY
                 self.assertEqual(
                     webhook_triggered_first.next_retry_date, first_retry_time
                 )
@@ -6339,14 +6433,14 @@ class WebhooksRetries(TestCase):
                 )
                 self.assertEqual(webhook_triggered_first.retry_counter, 1)
 
-            elapsed_times = [
-                (1, 2, 3, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
-                (2, 3, 12, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
-            ]
-            for try_count, delay, elapsed, status in elapsed_times:
-                fake_now = fake_now_0 + timedelta(minutes=delay)
-                next_retry_time = fake_now_0 + timedelta(minutes=elapsed)
-                with time_machine.travel(fake_now, tick=False):
+                elapsed_times = [
+                    (1, 2, 3, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
+                    (2, 3, 12, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
+                ]
+                for try_count, delay, elapsed, status in elapsed_times:
+                    fake_now = fake_now_0 + timedelta(minutes=delay)
+                    next_retry_time = fake_now_0 + timedelta(minutes=elapsed)
+                    traveller.move_to(fake_now)
                     await sync_to_async(retry_webhook_events)()
 
                     await webhook_triggered_first.arefresh_from_db()
@@ -6362,25 +6456,25 @@ class WebhooksRetries(TestCase):
                         next_retry_time,
                     )
 
-            # Update the retry counter and next_retry_date to mock the 6th
-            # retry.
-            fake_now_4 = fake_now_0 + timedelta(hours=18, minutes=12)
-            await webhook_triggered.aupdate(
-                retry_counter=6, next_retry_date=fake_now_4
-            )
-            elapsed_times = [
-                # 18:12
-                (1092, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
-                # 54:39
-                (3279, WEBHOOK_EVENT_STATUS.FAILED),
-            ]
-            # Run a test 18:12 hours after, it should update the retry counter
-            # to 7 and the next retry date to 36:27 hours later.
-            # Run a second test 54:39 later, since max tries are reached the
-            # webhook event should be not updated and marked as Failed.
-            for elapsed, status in elapsed_times:
-                fake_now = fake_now_0 + timedelta(minutes=elapsed)
-                with time_machine.travel(fake_now, tick=False):
+                # Update the retry counter and next_retry_date to mock the 6th
+                # retry.
+                fake_now_4 = fake_now_0 + timedelta(hours=18, minutes=12)
+                await webhook_triggered.aupdate(
+                    retry_counter=6, next_retry_date=fake_now_4
+                )
+                elapsed_times = [
+                    # 18:12
+                    (1092, WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY),
+                    # 54:39
+                    (3279, WEBHOOK_EVENT_STATUS.FAILED),
+                ]
+                # Run a test 18:12 hours after, it should update the retry
+                # counter to 7 and the next retry date to 36:27 hours later.
+                # Run a second test 54:39 later, since max tries are reached
+                # the webhook event should be not updated and marked as Failed.
+                for elapsed, status in elapsed_times:
+                    fake_now = fake_now_0 + timedelta(minutes=elapsed)
+                    traveller.move_to(fake_now)
                     await sync_to_async(retry_webhook_events)()
                     # Triggered
                     webhook_triggered_first = await webhook_triggered.afirst()
@@ -6410,15 +6504,7 @@ class WebhooksRetries(TestCase):
                         seven_retry_time,
                     )
 
-    def test_webhook_disabling(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_webhook_disabling(self):
         """Can we properly email failing webhook events and disable webhooks
         if max retries are expired?
 
@@ -6428,17 +6514,16 @@ class WebhooksRetries(TestCase):
         """
 
         fake_now = now()
-        webhook_e1 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_1'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
-        )
-        webhook_e2 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_2'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
+        webhook_e1, webhook_e2 = WebhookEvent.objects.bulk_create(
+            [
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content=f"{{'message': 'ok_{i}'}}",
+                    event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                )
+                for i in [1, 2]
+            ]
         )
         # (try_count, total_notifications_sent, webhook_enabled)
         iterations = [
@@ -6454,15 +6539,15 @@ class WebhooksRetries(TestCase):
         ]
         webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
         webhook_e2_compare = WebhookEvent.objects.filter(pk=webhook_e2.id)
-        for try_count, notification_out, webhook_enabled in iterations:
-            with mock.patch(
-                "cl.api.webhooks.requests.post",
-                side_effect=lambda *args, **kwargs: MockResponse(
-                    500, mock_raw=True
-                ),
-            ):
-                next_retry_date = fake_now + timedelta(minutes=3)
-                with time_machine.travel(next_retry_date, tick=False):
+        with mock.patch(
+            "cl.api.webhooks.requests.post",
+            side_effect=lambda *args, **kwargs: MockResponse(
+                500, mock_raw=True
+            ),
+        ):
+            next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
+            with time_machine.travel(next_retry_date, tick=False):
+                for try_count, notification_out, webhook_enabled in iterations:
                     expected_webhooks_to_retry = 2
                     expected_try_count = try_count
                     if try_count >= 8:
@@ -6481,30 +6566,19 @@ class WebhooksRetries(TestCase):
                     self.assertEqual(
                         webhooks_to_retry, expected_webhooks_to_retry
                     )
-                    self.assertEqual(
-                        webhook_e1_compare[0].event_status,
-                        status_to_compare,
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].event_status,
-                        status_to_compare,
-                    )
-                    self.assertEqual(
-                        webhook_e1_compare[0].retry_counter,
-                        expected_try_count,
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].retry_counter,
-                        expected_try_count,
-                    )
-                    self.assertEqual(
-                        webhook_e1_compare[0].webhook.enabled,
-                        webhook_enabled,
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].webhook.enabled,
-                        webhook_enabled,
-                    )
+                    for webhook_event in (webhook_e1, webhook_e2):
+                        webhook_event.refresh_from_db(
+                            fields=["event_status", "retry_counter"]
+                        )
+                        self.assertEqual(
+                            webhook_event.event_status, status_to_compare
+                        )
+                        self.assertEqual(
+                            webhook_event.retry_counter, expected_try_count
+                        )
+                    # Both events belong to self.webhook.
+                    self.webhook.refresh_from_db(fields=["enabled"])
+                    self.assertEqual(self.webhook.enabled, webhook_enabled)
                     self.assertEqual(len(mail.outbox), notification_out)
 
                     if notification_out >= 1:
@@ -6519,15 +6593,7 @@ class WebhooksRetries(TestCase):
                     webhook_e1_compare.update(next_retry_date=next_retry_date)
                     webhook_e2_compare.update(next_retry_date=next_retry_date)
 
-    def test_cut_off_time_for_retry_events_and_restore_retry_counter(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_cut_off_time_for_retry_events_and_restore_retry_counter(self):
         """Can we avoid retrying failing webhook events if they are older than
         HOURS_WEBHOOKS_CUT_OFF? They should be marked as failed.
 
@@ -6545,7 +6611,7 @@ class WebhooksRetries(TestCase):
                 content="{'message': 'ok_1'}",
                 event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                 retry_counter=7,
-                next_retry_date=fake_now_minus_2 + timedelta(minutes=3),
+                next_retry_date=fake_now_minus_2 + WEBHOOK_FIRST_RETRY_DELAY,
             )
         # Today
         with time_machine.travel(fake_now, tick=False):
@@ -6554,7 +6620,7 @@ class WebhooksRetries(TestCase):
                 content="{'message': 'ok_1'}",
                 event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                 retry_counter=2,
-                next_retry_date=fake_now + timedelta(minutes=3),
+                next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
             )
 
         # Today + 1 day
@@ -6565,7 +6631,7 @@ class WebhooksRetries(TestCase):
                 content="{'message': 'ok_2'}",
                 event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                 retry_counter=2,
-                next_retry_date=fake_now_1 + timedelta(minutes=3),
+                next_retry_date=fake_now_1 + WEBHOOK_FIRST_RETRY_DELAY,
             )
 
         # Today + HOURS_WEBHOOKS_CUT_OFF hours
@@ -6576,15 +6642,9 @@ class WebhooksRetries(TestCase):
                 content="{'message': 'ok_2'}",
                 event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                 retry_counter=3,
-                next_retry_date=fake_now_2 + timedelta(minutes=3),
+                next_retry_date=fake_now_2 + WEBHOOK_FIRST_RETRY_DELAY,
             )
 
-        webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
-        webhook_e2_compare = WebhookEvent.objects.filter(pk=webhook_e2.id)
-        webhook_e3_compare = WebhookEvent.objects.filter(pk=webhook_e3.id)
-        webhook_e4_compare = WebhookEvent.objects.filter(pk=webhook_e4.id)
-        webhook_compare = Webhook.objects.filter(pk=self.webhook.pk)
-
         with mock.patch(
             "cl.api.webhooks.requests.post",
             side_effect=lambda *args, **kwargs: MockResponse(
@@ -6592,23 +6652,22 @@ class WebhooksRetries(TestCase):
             ),
         ):
             # Today - HOURS_WEBHOOKS_CUT_OFF hours
-            next_retry_date = fake_now_minus_2 + timedelta(minutes=3)
+            next_retry_date = fake_now_minus_2 + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 # Retry webhook_e1, marked as Failed, and disable its parent
                 # webhook since max retries are reached.
                 webhooks_to_retry = retry_webhook_events()
                 self.assertEqual(webhooks_to_retry, 1)
+                webhook_e1.refresh_from_db(fields=["event_status"])
+                self.webhook.refresh_from_db(fields=["enabled"])
                 self.assertEqual(
-                    webhook_e1_compare[0].event_status,
+                    webhook_e1.event_status,
                     WEBHOOK_EVENT_STATUS.FAILED,
                 )
-                self.assertEqual(
-                    webhook_compare[0].enabled,
-                    False,
-                )
+                self.assertEqual(self.webhook.enabled, False)
 
             # Today + HOURS_WEBHOOKS_CUT_OFF hours
-            next_retry_date = fake_now_2 + timedelta(minutes=3)
+            next_retry_date = fake_now_2 + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 # No webhook events should be retried since
                 # parent webhook is disabled.
@@ -6632,56 +6691,48 @@ class WebhooksRetries(TestCase):
                 # Retry pending webhook events.
                 webhooks_to_retry = retry_webhook_events()
                 self.assertEqual(webhooks_to_retry, 2)
+                for webhook_event in (webhook_e2, webhook_e3, webhook_e4):
+                    webhook_event.refresh_from_db(
+                        fields=["event_status", "retry_counter"]
+                    )
 
                 # webhook_e3 and webhook_e4 delivered successfully
                 self.assertEqual(
-                    webhook_e3_compare[0].event_status,
+                    webhook_e3.event_status,
                     WEBHOOK_EVENT_STATUS.SUCCESSFUL,
                 )
                 self.assertEqual(
-                    webhook_e4_compare[0].event_status,
+                    webhook_e4.event_status,
                     WEBHOOK_EVENT_STATUS.SUCCESSFUL,
                 )
-                self.assertEqual(webhook_e3_compare[0].retry_counter, 0)
-                self.assertEqual(webhook_e4_compare[0].retry_counter, 0)
+                self.assertEqual(webhook_e3.retry_counter, 0)
+                self.assertEqual(webhook_e4.retry_counter, 0)
 
                 # webhook_e2 marked as failed since it's older than
-                # HOURS_WEBHOOKS_CUT_OFF.
+                # HOURS_WEBHOOKS_CUT_OFF, and its retry counter is untouched.
                 self.assertEqual(
-                    webhook_e2_compare[0].event_status,
+                    webhook_e2.event_status,
                     WEBHOOK_EVENT_STATUS.FAILED,
                 )
-                self.assertEqual(
-                    webhook_e2_compare[0].retry_counter,
-                    webhook_e2.retry_counter,
-                )
+                self.assertEqual(webhook_e2.retry_counter, 2)
 
-    def test_webhook_continues_failing_after_an_event_delivery(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_webhook_continues_failing_after_an_event_delivery(self):
         """Can we properly continue emailing failing webhook events emails
         after the oldest webhook event is delivered but then the webhook
         endpoint continues failing?
         """
 
         fake_now = now()
-        webhook_e1 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_1'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
-        )
-        webhook_e2 = WebhookEventFactory(
-            webhook=self.webhook,
-            content="{'message': 'ok_2'}",
-            event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
-            next_retry_date=fake_now + timedelta(minutes=3),
+        webhook_e1, webhook_e2 = WebhookEvent.objects.bulk_create(
+            [
+                WebhookEventFactory.build(
+                    webhook=self.webhook,
+                    content=f"{{'message': 'ok_{i}'}}",
+                    event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
+                    next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
+                )
+                for i in [1, 2]
+            ]
         )
         # (try_count, total_notifications_sent, webhook_enabled)
         iterations = [
@@ -6692,32 +6743,34 @@ class WebhooksRetries(TestCase):
         ]
         webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
         webhook_e2_compare = WebhookEvent.objects.filter(pk=webhook_e2.id)
-        for try_count, notification_out in iterations:
-            # Try to deliver webhook_e1 and webhook_e2 4 times.
-            with mock.patch(
+        next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
+        with (
+            mock.patch(
                 "cl.api.webhooks.requests.post",
                 side_effect=lambda *args, **kwargs: MockResponse(
                     500, mock_raw=True
                 ),
-            ):
-                next_retry_date = fake_now + timedelta(minutes=3)
-                with time_machine.travel(next_retry_date, tick=False):
-                    webhooks_to_retry = retry_webhook_events()
-                    self.assertEqual(webhooks_to_retry, 2)
-                    self.assertEqual(len(mail.outbox), notification_out)
+            ),
+            time_machine.travel(next_retry_date, tick=False),
+        ):
+            for try_count, notification_out in iterations:
+                # Try to deliver webhook_e1 and webhook_e2 4 times.
+                webhooks_to_retry = retry_webhook_events()
+                self.assertEqual(webhooks_to_retry, 2)
+                self.assertEqual(len(mail.outbox), notification_out)
 
-                    # Restore webhook event to test the remaining options
-                    webhook_e1_compare.update(
-                        next_retry_date=webhook_e1.next_retry_date,
-                    )
+                # Restore webhook event to test the remaining options
+                webhook_e1_compare.update(
+                    next_retry_date=webhook_e1.next_retry_date,
+                )
+                webhook_e2_compare.update(
+                    next_retry_date=webhook_e2.next_retry_date
+                )
+                if try_count == 4:
                     webhook_e2_compare.update(
                         next_retry_date=webhook_e2.next_retry_date
+                        + WEBHOOK_FIRST_RETRY_DELAY,
                     )
-                    if try_count == 4:
-                        webhook_e2_compare.update(
-                            next_retry_date=webhook_e2.next_retry_date
-                            + timedelta(minutes=3),
-                        )
 
         with mock.patch(
             "cl.api.webhooks.requests.post",
@@ -6726,12 +6779,13 @@ class WebhooksRetries(TestCase):
             ),
         ):
             # Deliver webhook_e1 successfully.
-            next_retry_date = fake_now + timedelta(minutes=3)
+            next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 webhooks_to_retry = retry_webhook_events()
                 self.assertEqual(webhooks_to_retry, 1)
+                webhook_e1.refresh_from_db(fields=["event_status"])
                 self.assertEqual(
-                    webhook_e1_compare[0].event_status,
+                    webhook_e1.event_status,
                     WEBHOOK_EVENT_STATUS.SUCCESSFUL,
                 )
 
@@ -6744,67 +6798,63 @@ class WebhooksRetries(TestCase):
         # Continue trying to deliver webhook_e2 4 more times. Mocking a
         # failing webhook endpoint. Send a webhook failing notification on the
         # 6th try, and disable the webhook endpoint on the 8th try.
-        for try_count, notification_out, webhook_enabled in iterations:
-            with mock.patch(
+        next_retry_date = fake_now + timedelta(minutes=6)
+        with (
+            mock.patch(
                 "cl.api.webhooks.requests.post",
                 side_effect=lambda *args, **kwargs: MockResponse(
                     500, mock_raw=True
                 ),
-            ):
-                next_retry_date = fake_now + timedelta(minutes=6)
-                with time_machine.travel(next_retry_date, tick=False):
-                    expected_webhooks_to_retry = 1
-                    expected_try_count = try_count
-                    if try_count >= 8:
-                        # After the 8 try, the webhook event is marked as
-                        # Failed.
-                        status_to_compare = WEBHOOK_EVENT_STATUS.FAILED
-                    else:
-                        status_to_compare = WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY
-
-                    if try_count >= 9:
-                        # No webhook events should be retried after 8 tries.
-                        expected_webhooks_to_retry = 0
-                        expected_try_count = 8
+            ),
+            time_machine.travel(next_retry_date, tick=False),
+        ):
+            for try_count, notification_out, webhook_enabled in iterations:
+                expected_webhooks_to_retry = 1
+                expected_try_count = try_count
+                if try_count >= 8:
+                    # After the 8 try, the webhook event is marked as
+                    # Failed.
+                    status_to_compare = WEBHOOK_EVENT_STATUS.FAILED
+                else:
+                    status_to_compare = WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY
+
+                if try_count >= 9:
+                    # No webhook events should be retried after 8 tries.
+                    expected_webhooks_to_retry = 0
+                    expected_try_count = 8
 
-                    webhooks_to_retry = retry_webhook_events()
-                    self.assertEqual(
-                        webhooks_to_retry, expected_webhooks_to_retry
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].event_status,
-                        status_to_compare,
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].retry_counter,
-                        expected_try_count,
-                    )
-                    self.assertEqual(
-                        webhook_e2_compare[0].webhook.enabled,
-                        webhook_enabled,
-                    )
-                    self.assertEqual(len(mail.outbox), notification_out)
+                webhooks_to_retry = retry_webhook_events()
+                self.assertEqual(webhooks_to_retry, expected_webhooks_to_retry)
+                webhook_e2.refresh_from_db(
+                    fields=["event_status", "retry_counter"]
+                )
+                self.webhook.refresh_from_db(fields=["enabled"])
+                self.assertEqual(
+                    webhook_e2.event_status,
+                    status_to_compare,
+                )
+                self.assertEqual(
+                    webhook_e2.retry_counter,
+                    expected_try_count,
+                )
+                self.assertEqual(
+                    self.webhook.enabled,
+                    webhook_enabled,
+                )
+                self.assertEqual(len(mail.outbox), notification_out)
 
-                    if notification_out >= 1:
-                        message = mail.outbox[notification_out - 1]
-                        subject_to_compare = "webhook is failing"
-                        if try_count in [8, 9]:
-                            subject_to_compare = "webhook is now disabled"
-                        self.assertIn(subject_to_compare, message.subject)
+                if notification_out >= 1:
+                    message = mail.outbox[notification_out - 1]
+                    subject_to_compare = "webhook is failing"
+                    if try_count in [8, 9]:
+                        subject_to_compare = "webhook is now disabled"
+                    self.assertIn(subject_to_compare, message.subject)
 
-                    webhook_e2_compare.update(
-                        next_retry_date=webhook_e2.next_retry_date,
-                    )
+                webhook_e2_compare.update(
+                    next_retry_date=webhook_e2.next_retry_date,
+                )
 
-    def test_delete_old_webhook_events(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_delete_old_webhook_events(self):
         """Can we properly delete webhook events older than DAYS_TO_DELETE days?
 
         The delete_old_webhook_events is only executed once a day at 12:00 UTC.
@@ -6812,11 +6862,11 @@ class WebhooksRetries(TestCase):
 
         fake_days_ago = now() - timedelta(days=DAYS_TO_DELETE + 1)
         with time_machine.travel(fake_days_ago, tick=False):
-            webhook_e1 = WebhookEventFactory(
-                webhook=self.webhook,
-            )
-            webhook_e2 = WebhookEventFactory(
-                webhook=self.webhook,
+            WebhookEvent.objects.bulk_create(
+                [
+                    WebhookEventFactory.build(webhook=self.webhook)
+                    for _ in range(2)
+                ]
             )
 
         webhook_e3 = WebhookEventFactory(
@@ -6847,15 +6897,7 @@ class WebhooksRetries(TestCase):
         # webhook_e3 should still exist.
         self.assertEqual(webhook_events[0].pk, webhook_e3.pk)
 
-    def test_send_notifications_if_webhook_still_disabled(
-        self,
-        mock_is_docket_entry_sealed,
-        mock_enqueue_alert,
-        mock_bucket_open,
-        mock_cookies,
-        mock_pacer_court_accessible,
-        mock_get_document_number_from_confirmation_page,
-    ):
+    def test_send_notifications_if_webhook_still_disabled(self):
         """Can we send a notification to users if one of their webhooks is
         still disabled, one, two and three days after?
         """
@@ -6874,10 +6916,9 @@ class WebhooksRetries(TestCase):
                 content="{'message': 'ok_1'}",
                 event_status=WEBHOOK_EVENT_STATUS.ENQUEUED_RETRY,
                 retry_counter=7,
-                next_retry_date=fake_now + timedelta(minutes=3),
+                next_retry_date=fake_now + WEBHOOK_FIRST_RETRY_DELAY,
             )
 
-        webhook_e1_compare = WebhookEvent.objects.filter(pk=webhook_e1.id)
         with mock.patch(
             "cl.api.webhooks.requests.post",
             side_effect=lambda *args, **kwargs: MockResponse(
@@ -6885,18 +6926,17 @@ class WebhooksRetries(TestCase):
             ),
         ):
             # Time to retry
-            next_retry_date = fake_now + timedelta(minutes=3)
+            next_retry_date = fake_now + WEBHOOK_FIRST_RETRY_DELAY
             with time_machine.travel(next_retry_date, tick=False):
                 webhooks_to_retry = retry_webhook_events()
                 self.assertEqual(webhooks_to_retry, 1)
+                webhook_e1.refresh_from_db(fields=["event_status"])
+                self.webhook.refresh_from_db(fields=["enabled"])
                 self.assertEqual(
-                    webhook_e1_compare[0].event_status,
+                    webhook_e1.event_status,
                     WEBHOOK_EVENT_STATUS.FAILED,
                 )
-                self.assertEqual(
-                    webhook_e1_compare[0].webhook.enabled,
-                    False,
-                )
+                self.assertEqual(self.webhook.enabled, False)
                 self.assertEqual(len(mail.outbox), 1)
                 subject_to_compare = "webhook is now disabled"
                 message = mail.outbox[0]
@@ -1,10 +1,11 @@
+from collections import defaultdict
 from typing import Any
 
-from django.db.models import Max, Min
+from django.db.models import Exists, Max, Min, OuterRef, Prefetch, Q
 
 from cl.lib.elasticsearch_utils import get_opinions_coverage_chart_data
 from cl.search.documents import OpinionClusterDocument
-from cl.search.models import SOURCES, Court, Docket, OpinionCluster
+from cl.search.models import SOURCES, Court, Courthouse, Docket, OpinionCluster
 
 
 async def fetch_data(jurisdictions, group_by_state=True):
@@ -16,44 +17,68 @@ async def fetch_data(jurisdictions, group_by_state=True):
     :param group_by_state: Do we group by states
     :return: Ordered court data
     """
-    courts = {}
-    async for court in Court.objects.filter(
-        jurisdiction__in=jurisdictions,
-        parent_court__isnull=True,
-    ).exclude(appeals_to__id="cafc"):
-        court_has_content = await Docket.objects.filter(court=court).aexists()
-        descendant_json = await get_descendants_dict(court)
+    has_dockets = Exists(Docket.objects.filter(court=OuterRef("pk")))
+    # Load every child court up front, flagged with whether it has dockets,
+    # so walking the court tree doesn't query the DB for each court in it.
+    child_courts = defaultdict(list)
+    async for child_court in Court.objects.filter(
+        parent_court__isnull=False
+    ).annotate(has_dockets=has_dockets):
+        child_courts[child_court.parent_court_id].append(child_court)
+
+    top_level_courts = (
+        Court.objects.filter(
+            jurisdiction__in=jurisdictions,
+            parent_court__isnull=True,
+        )
+        .exclude(appeals_to__id="cafc")
+        .annotate(has_dockets=has_dockets)
+    )
+    if group_by_state:
+        top_level_courts = top_level_courts.prefetch_related(
+            Prefetch(
+                "courthouses",
+                queryset=Courthouse.objects.only("court_id", "state").order_by(
+                    "pk"
+                ),
+            )
+        )
+
+    courts = defaultdict(list)
+    async for court in top_level_courts:
+        descendant_json = get_descendants_dict(court, child_courts)
         # Dont add any courts without a docket associated with it or
         # a descendant court
-        if not court_has_content and not descendant_json:
+        if not court.has_dockets and not descendant_json:
             continue
         if group_by_state:
-            courthouse = await court.courthouses.afirst()
+            courthouse = court.courthouses.all()[0]
             state = courthouse.get_state_display()
         else:
             state = "NONE"
-        courts.setdefault(state, []).append(
+        courts[state].append(
             {
                 "court": court,
                 "descendants": descendant_json,
             }
         )
-    return courts
+    return dict(courts)
 
 
-async def get_descendants_dict(court):
+def get_descendants_dict(court, child_courts):
     """Get descendants (if any) of court
 
     A simple method to help recsuively iterate for child courts
 
     :param court: Court object
+    :param child_courts: A dict mapping court IDs to their child courts,
+    annotated with has_dockets
     :return: Descendant courts
     """
     descendants = []
-    async for child_court in court.child_courts.all():
-        child_descendants = await get_descendants_dict(child_court)
-        court_has_content = Docket.objects.filter(court=child_court).aexists()
-        if court_has_content or child_descendants:
+    for child_court in child_courts[court.pk]:
+        child_descendants = get_descendants_dict(child_court, child_courts)
+        if child_court.has_dockets or child_descendants:
             descendants.append(
                 {"court": child_court, "descendants": child_descendants}
             )
@@ -65,10 +90,38 @@ async def fetch_federal_data():
 
     :return: A dict with the data in it
     """
+    courthouse_states = Prefetch(
+        "courthouses", queryset=Courthouse.objects.only("court_id", "state")
+    )
+    bankruptcy_jurisdictions = [
+        Court.FEDERAL_BANKRUPTCY,
+        Court.FEDERAL_BANKRUPTCY_PANEL,
+    ]
+    label_filters = {
+        "district": lambda c: c.jurisdiction == Court.FEDERAL_DISTRICT,
+        "bankruptcy": lambda c: c.jurisdiction in bankruptcy_jurisdictions,
+        # Old circuit courts
+        "circuit": lambda c: c.parent_court_id == "uscirct",
+    }
+    # Fetch the courts grouped under the circuits once, along with their
+    # courthouse states, and sort them into each circuit below.
+    lower_courts = [
+        (lower_court, {ch.state for ch in lower_court.courthouses.all()})
+        async for lower_court in Court.objects.filter(
+            Q(
+                jurisdiction__in=[
+                    Court.FEDERAL_DISTRICT,
+                    *bankruptcy_jurisdictions,
+                ]
+            )
+            | Q(parent_court__id="uscirct")
+        ).prefetch_related(courthouse_states)
+    ]
+
     court_data = {}
     async for court in Court.objects.filter(
         jurisdiction=Court.FEDERAL_APPELLATE, parent_court__isnull=True
-    ):
+    ).prefetch_related(courthouse_states):
         court_data[court.id] = {
             "name": court.short_name,
             "id": court.id,
@@ -84,33 +137,21 @@ async def fetch_federal_data():
                 accepts_appeals_from[appealing_court.id] = appealing_court
             court_data[court.id]["appeals_from"] = accepts_appeals_from
         else:
-            filter_pairs = {
-                "district": {
-                    "jurisdiction": Court.FEDERAL_DISTRICT,
-                },
-                "bankruptcy": {
-                    "jurisdiction__in": [
-                        Court.FEDERAL_BANKRUPTCY,
-                        Court.FEDERAL_BANKRUPTCY_PANEL,
-                    ]
-                },
-                # Old circuit courts
-                "circuit": {"parent_court__id": "uscirct"},
+            states_in_circuit = {
+                courthouse.state for courthouse in court.courthouses.all()
             }
-            states_in_circuit = [
-                courthouse["state"]
-                async for courthouse in court.courthouses.values("state")
-            ]
             # Add district court for canal zone
             if court.id == "ca5":
-                states_in_circuit.extend(["CZ"])
-            for label, filters in filter_pairs.items():
+                states_in_circuit.add("CZ")
+            for label, in_label in label_filters.items():
                 # Get all the other courts in the geographic area of the
                 # circuit court
-                court_data[court.id][label] = Court.objects.filter(
-                    courthouses__state__in=states_in_circuit,
-                    **filters,
-                ).distinct()
+                court_data[court.id][label] = [
+                    lower_court
+                    for lower_court, states in lower_courts
+                    if in_label(lower_court)
+                    and not states.isdisjoint(states_in_circuit)
+                ]
     return court_data
 
 
@@ -1,10 +1,19 @@
 import logging
 import sys
 import warnings
+from contextlib import AbstractContextManager, nullcontext
 from unittest import TestLoader
 
+import pgtrigger
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission, User
+from django.core.management import call_command
+from django.db.models.signals import post_migrate
 from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
 from override_storage import override_storage
+from rest_framework.authtoken.models import Token
 
 from cl.tests.cases import (
     APITestCase,
@@ -14,6 +23,7 @@ from cl.tests.cases import (
     TestCase,
     TransactionTestCase,
 )
+from cl.users.models import UserProfile
 
 
 class OurCasesTestLoader(TestLoader):
@@ -38,12 +48,70 @@ class OurCasesTestLoader(TestLoader):
         return super().loadTestsFromTestCase(testCaseClass)
 
 
+class DisableMigrations:
+    """A MIGRATION_MODULES stand-in that reports no migrations for any app,
+    so the test database schema is created straight from the models.
+    """
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+def load_initial_test_data(sender, using, **kwargs):
+    """Load the rows our data migrations would have created for the tests.
+
+    When migrations are skipped, nothing inserts the truncated court and
+    school fixtures, the recap users or the pghistory triggers, so recreate
+    them here once the schema exists. post_migrate fires again on --keepdb
+    reruns, so every insert here must tolerate existing rows.
+    """
+    call_command(
+        "loaddata",
+        "court_data_truncated",
+        app_label="search",
+        database=using,
+        verbosity=0,
+    )
+    for fixture in ["school_data_truncated", "races"]:
+        call_command(
+            "loaddata",
+            fixture,
+            app_label="people_db",
+            database=using,
+            verbosity=0,
+        )
+
+    Group.objects.using(using).get_or_create(name="tenn_work_uploaders")
+    permission = Permission.objects.using(using).get(
+        codename="has_recap_upload_access"
+    )
+    for username in ["recap", "recap-email"]:
+        user, _ = User.objects.db_manager(using).get_or_create(
+            username=username,
+            defaults={
+                "email": f"{username}@free.law",
+                "password": make_password(None),
+            },
+        )
+        UserProfile.objects.using(using).get_or_create(
+            user=user, defaults={"email_confirmed": True}
+        )
+        user.user_permissions.add(permission)
+        Token.objects.using(using).get_or_create(user_id=user.pk)
+
+    pgtrigger.install(database=using)
+
+
 class TestRunner(DiscoverRunner):
     test_loader = OurCasesTestLoader()
 
-    def __init__(self, *args, enable_logging, **kwargs):
+    def __init__(self, *args, enable_logging, nomigrations, **kwargs):
         super().__init__(*args, **kwargs)
         self.enable_logging = enable_logging
+        self.nomigrations = nomigrations
 
     @classmethod
     def add_arguments(cls, parser):
@@ -54,6 +122,13 @@ class TestRunner(DiscoverRunner):
             default=False,
             help="Display all log lines",
         )
+        parser.add_argument(
+            "--nomigrations",
+            action="store_true",
+            default=False,
+            help="Build the test database from the models instead of "
+            "running every migration. Pair with --keepdb for fast reruns.",
+        )
         super().add_arguments(parser)
 
         # Modify parallel option to default to number of CPU cores
@@ -68,8 +143,19 @@ class TestRunner(DiscoverRunner):
         # Force to always delete the database if it exists
         interactive = self.interactive
         self.interactive = False
+        migration_modules: AbstractContextManager = nullcontext()
+        if self.nomigrations:
+            migration_modules = override_settings(
+                MIGRATION_MODULES=DisableMigrations()
+            )
+            post_migrate.connect(
+                load_initial_test_data,
+                sender=apps.get_app_config("users"),
+                dispatch_uid="load_initial_test_data",
+            )
         try:
-            return super().setup_databases(**kwargs)
+            with migration_modules:
+                return super().setup_databases(**kwargs)
         finally:
             self.interactive = interactive
 